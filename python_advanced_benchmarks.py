@@ -0,0 +1,1218 @@
+"""
+PYTHON ADVANCED FEATURES BENCHMARKS
+===================================
+
+Micro-benchmarks for the performance-oriented parts of the tutorial and
+quiz modules. Each benchmark prints its own small report.
+
+Usage:
+    python python_advanced_benchmarks.py            # run every benchmark
+    python python_advanced_benchmarks.py shapes     # run selected ones
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+
+def _load_tutorial():
+    """
+    Import the tutorial module (importing it runs no examples).
+
+    Returns:
+        module: The python_advanced_tutorial module
+    """
+    import python_advanced_tutorial
+    return python_advanced_tutorial
+
+
+def _best_time(func, repeat=5):
+    """
+    Run func several times and return the fastest wall-clock time.
+
+    Args:
+        func: A zero-argument callable to time
+        repeat (int): How many times to run it
+
+    Returns:
+        float: The best time in seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _header(title):
+    """Print a benchmark section header."""
+    print("\n" + "=" * 60)
+    print(title)
+    print("=" * 60)
+
+
+# ============================================================================
+# SHAPES: scalar objects vs ShapeArray
+# ============================================================================
+
+def bench_shapes(n=1_000_000):
+    """
+    Compare per-object area()/perimeter() with the vectorized ShapeArray.
+
+    Args:
+        n (int): Number of shapes per batch
+    """
+    tutorial = _load_tutorial()
+    _header(f"SHAPES: {n:,} rectangles and circles")
+    if tutorial.np is None:
+        print("  NumPy is not installed - skipping")
+        return
+
+    rng = tutorial.np.random.default_rng(0)
+    widths, heights, radii = rng.random((3, n)) * 100
+    rectangles = [tutorial.Rectangle(w, h) for w, h in zip(widths.tolist(), heights.tolist())]
+    circles = [tutorial.Circle(r) for r in radii.tolist()]
+    rect_array = tutorial.RectangleArray(widths, heights)
+    circle_array = tutorial.CircleArray(radii)
+
+    scalar = _best_time(lambda: ([r.area() for r in rectangles], [r.perimeter() for r in rectangles],
+                                 [c.area() for c in circles], [c.perimeter() for c in circles]), 3)
+    vectorized = _best_time(lambda: (rect_array.area(), rect_array.perimeter(),
+                                     circle_array.area(), circle_array.perimeter()), 3)
+
+    identical = (rect_array.area().tolist() == [r.area() for r in rectangles]
+                 and rect_array.perimeter().tolist() == [r.perimeter() for r in rectangles]
+                 and circle_array.area().tolist() == [c.area() for c in circles]
+                 and circle_array.perimeter().tolist() == [c.perimeter() for c in circles])
+
+    print(f"  Scalar methods:   {scalar * 1000:9.2f} ms")
+    print(f"  ShapeArray:       {vectorized * 1000:9.2f} ms  ({scalar / vectorized:.0f}x faster)")
+    print(f"  Bit-identical:    {identical}")
+
+
+# ============================================================================
+# PERSON: Person vs SlottedPerson memory and construction
+# ============================================================================
+
+def _bytes_per_object(factory, n):
+    """
+    Measure the traced allocation cost of building n objects.
+
+    Args:
+        factory: A callable returning a list of n objects
+        n (int): How many objects factory builds
+
+    Returns:
+        float: Bytes allocated per object (excluding the list itself)
+    """
+    import tracemalloc
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = factory()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before - sys.getsizeof(objects)) / n
+
+
+def bench_person(n=200_000):
+    """
+    Compare memory and construction cost of Person and SlottedPerson.
+
+    Args:
+        n (int): Number of records
+    """
+    tutorial = _load_tutorial()
+    _header(f"PERSON: {n:,} records")
+    records = [(f"person{i}", i % 100) for i in range(n)]
+    # Pre-build the names so only the objects themselves are measured
+    names = [name for name, _ in records]
+
+    person_bytes = _bytes_per_object(lambda: [tutorial.Person(name, 30) for name in names], n)
+    slotted_bytes = _bytes_per_object(lambda: [tutorial.SlottedPerson(name, 30) for name in names], n)
+
+    with contextlib.redirect_stdout(io.StringIO()):  # Person's setter prints
+        looped = _best_time(lambda: [_set_all(tutorial.Person("x", 0), name, age) for name, age in records], 3)
+    bulk = _best_time(lambda: tutorial.SlottedPerson.from_records(records), 3)
+
+    print(f"  Memory per Person:         {person_bytes:6.1f} bytes")
+    print(f"  Memory per SlottedPerson:  {slotted_bytes:6.1f} bytes")
+    print(f"  Person() + setters loop:   {looped * 1000:8.2f} ms")
+    print(f"  SlottedPerson.from_records:{bulk * 1000:8.2f} ms  ({looped / bulk:.1f}x faster)")
+
+
+def _set_all(person, name, age):
+    """Assign name and age through the validating setters."""
+    person.name = name
+    person.age = age
+    return person
+
+
+def bench_person_table(n=1_000_000):
+    """
+    Compare per-object age validation with PersonTable's column checks.
+
+    Args:
+        n (int): Number of rows
+    """
+    tutorial = _load_tutorial()
+    _header(f"PERSON TABLE: {n:,} rows")
+    if tutorial.np is None:
+        print("  NumPy is not installed - skipping")
+        return
+
+    names = [f"person{i}" for i in range(n)]
+    ages = [i % 100 for i in range(n)]
+
+    def per_object():
+        people = [tutorial.SlottedPerson(name, 0) for name in names]
+        for person, age in zip(people, ages):
+            person.age = age
+        return [person.is_adult for person in people]
+
+    looped = _best_time(per_object, 3)
+    columnar = _best_time(lambda: tutorial.PersonTable(names, ages).is_adult, 3)
+
+    print(f"  Per-object setter + is_adult: {looped * 1000:8.2f} ms")
+    print(f"  PersonTable + is_adult mask:  {columnar * 1000:8.2f} ms  ({looped / columnar:.1f}x faster)")
+
+
+# ============================================================================
+# DECORATORS: closure wrappers vs make_decorator
+# ============================================================================
+
+def _per_call_ns(func, arg, number=1_000_000):
+    """
+    Measure the average cost of func(arg) in nanoseconds.
+
+    Args:
+        func: A one-argument callable
+        arg: The argument to pass
+        number (int): Calls per timing run
+
+    Returns:
+        float: Best average nanoseconds per call
+    """
+    import timeit
+
+    timer = timeit.Timer("func(arg)", globals={"func": func, "arg": arg})
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def bench_decorators():
+    """
+    Compare the call overhead of closure wrappers and make_decorator.
+
+    Returns:
+        bool: False if make_decorator broke a callable it wrapped
+    """
+    tutorial = _load_tutorial()
+    _header("DECORATORS: per-call overhead")
+
+    def double(x):
+        return x * 2
+
+    def generic_closure(func):
+        def wrapper(*args, **kwargs):
+            return func(*args, **kwargs) * 2
+        return wrapper
+
+    def times_two(result):
+        return result * 2
+
+    candidates = [
+        ("undecorated function", double),
+        ("*args/**kwargs closure", generic_closure(double)),
+        ("multiply_decorator (fixed x)", tutorial.multiply_decorator(double)),
+        ("make_decorator(transform=...)", tutorial.make_decorator(transform=times_two)(double)),
+        ("make_decorator() (no hooks)", tutorial.make_decorator()(double)),
+    ]
+    costs = [(label, _per_call_ns(func, 21)) for label, func in candidates]
+    baseline = costs[0][1]
+    for label, cost in costs:
+        print(f"  {label:32s} {cost:7.1f} ns/call  ({cost - baseline:+6.1f} ns)")
+
+    # Callables without an exact signature must still be wrappable, and
+    # wrapping a functools.wraps wrapper must keep the inner defaults
+    import functools
+
+    def add(x, y=2):
+        return x + y
+
+    def passthrough(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return func(*args, **kwargs)
+        return wrapper
+
+    class Doubler:
+        def __call__(self, x):
+            return x * 2
+
+    double_it = tutorial.make_decorator(transform=times_two)
+    checks = [
+        ("functools.partial", functools.partial(add, y=5), 1, 12),
+        ("callable instance", Doubler(), 3, 12),
+        ("functools.wraps wrapper", passthrough(add), 1, 6),
+        ("memoize() wrapper", tutorial.memoize()(add), 1, 6),
+    ]
+    for label, func, arg, expected in checks:
+        try:
+            result = double_it(func)(arg)
+        except Exception as exc:
+            result = exc
+        if result != expected:
+            print(f"  ❌ Wrapping a {label} gave {result!r}, expected {expected!r}")
+            return False
+    print("  ✅ Partials, callable objects and wrapped functions keep working")
+    return True
+
+
+def bench_decorator_stacks(max_depth=6):
+    """
+    Show how per-call latency grows with stack depth, fused vs unfused.
+
+    Args:
+        max_depth (int): The deepest stack to measure
+
+    Returns:
+        bool: False if fusing dropped a decorator from the middle of a stack
+    """
+    tutorial = _load_tutorial()
+    _header("DECORATOR STACKS: latency vs depth")
+
+    def double(x):
+        return x * 2
+
+    def closure_multiply(factor):
+        # Same shape as the tutorial's multiply_decorator/other_decorator
+        def decorator(func):
+            def wrapper(x):
+                return func(x) * factor
+            return wrapper
+        return decorator
+
+    def callable_multiply(factor):
+        def transform(result):
+            return result * factor
+        return transform
+
+    print(f"  {'depth':>5}  {'nested closures':>16}  {'fused (callable)':>16}  {'fused (inline)':>16}")
+    for depth in range(1, max_depth + 1):
+        factors = [2, 4, 2, 4, 2, 4][:depth]
+        nested = double
+        for factor in factors:
+            nested = closure_multiply(factor)(nested)
+        fused_callable = tutorial.compose(*[tutorial.make_decorator(transform=callable_multiply(f))
+                                            for f in reversed(factors)])(double)
+        fused_inline = tutorial.compose(*[tutorial.make_decorator(transform=tutorial.MultiplyBy(f))
+                                          for f in reversed(factors)])(double)
+        assert nested(10) == fused_callable(10) == fused_inline(10)
+        costs = [_per_call_ns(func, 10, number=300_000) for func in (nested, fused_callable, fused_inline)]
+        print(f"  {depth:>5}  " + "  ".join(f"{cost:13.1f} ns" for cost in costs))
+
+    # A decorator that isn't a make_decorator (and copies the inner
+    # wrapper's attributes with functools.wraps) must stay in the stack
+    import functools
+
+    for label, middle in [("memoize()", tutorial.memoize()), ("functools.lru_cache", functools.lru_cache)]:
+        calls = []
+
+        def counted(x):
+            calls.append(x)
+            return x * 2
+
+        def defaulted(x, y=2):
+            return x + y
+
+        stacked = tutorial.make_decorator(transform=tutorial.MultiplyBy(2))(
+            middle(tutorial.make_decorator(transform=tutorial.MultiplyBy(3))(counted)))
+        results = [stacked(10), stacked(10)]
+        if results != [120, 120] or len(calls) != 1:
+            print(f"  ❌ {label} in the middle of a fused stack was dropped")
+            return False
+        # The wrapped function's defaults must survive the middle layer too
+        stacked = tutorial.make_decorator(transform=tutorial.MultiplyBy(2))(
+            middle(tutorial.make_decorator(transform=tutorial.MultiplyBy(3))(defaulted)))
+        try:
+            results = [stacked(1), stacked(1, 4)]
+        except TypeError as exc:
+            results = exc
+        if results != [18, 30]:
+            print(f"  ❌ {label} in the middle of a fused stack lost defaults: {results!r}")
+            return False
+    print("  ✅ Non-fusible decorators in the middle of a stack are kept")
+    return True
+
+
+def bench_memoize(calls=200_000):
+    """
+    Show memoize's hit rate and speedup on a skewed input distribution.
+
+    Args:
+        calls (int): Number of calls per run
+    """
+    import random
+
+    tutorial = _load_tutorial()
+    _header(f"MEMOIZE: {calls:,} calls with a Zipf-like input distribution")
+
+    def work(n):
+        return sum(i * i for i in range(200 + n % 200))
+
+    rng = random.Random(0)
+    inputs = [int(rng.paretovariate(1.2)) for _ in range(calls)]
+
+    uncached = _best_time(lambda: [work(n) for n in inputs], 3)
+    print(f"  {'uncached':>12}: {uncached * 1000:8.2f} ms")
+    for maxsize in (8, 64, 512, None):
+        cached = tutorial.memoize(maxsize=maxsize)(work)
+        elapsed = _best_time(lambda: [cached(n) for n in inputs], 1)
+        info = cached.cache_info()
+        hit_rate = info.hits / (info.hits + info.misses)
+        print(f"  {'maxsize=' + str(maxsize):>12}: {elapsed * 1000:8.2f} ms  "
+              f"hit rate {hit_rate:6.1%}  evictions {info.evictions:,}")
+
+
+def bench_async_repeat(n=50, latency=0.02):
+    """
+    Compare sequential and concurrent repeats of an I/O-bound coroutine.
+
+    Args:
+        n (int): Number of repeated calls
+        latency (float): Simulated I/O latency per call in seconds
+    """
+    import asyncio
+
+    tutorial = _load_tutorial()
+    _header(f"ASYNC REPEAT: {n} calls x {latency * 1000:.0f} ms latency")
+
+    async def poll():
+        await asyncio.sleep(latency)
+        return True
+
+    for concurrency in (1, 10, None):
+        repeated = tutorial.repeat(n, concurrency=concurrency)(poll)
+        elapsed = _best_time(lambda: asyncio.run(repeated()), 3)
+        print(f"  concurrency={str(concurrency):>4}: {elapsed * 1000:8.1f} ms  "
+              f"({elapsed / latency:5.1f} x latency)")
+
+
+def count_primes(limit):
+    """
+    Count primes below limit by trial division (a CPU-bound workload).
+
+    Defined at module level so worker processes can unpickle it.
+    """
+    return sum(all(n % d for d in range(2, int(n ** 0.5) + 1)) for n in range(2, limit))
+
+
+def bench_parallel_repeat(n=8, limit=60_000):
+    """
+    Compare repeat() executors on a CPU-bound function.
+
+    Args:
+        n (int): Number of repeated calls
+        limit (int): Work per call (primes below limit)
+    """
+    tutorial = _load_tutorial()
+    _header(f"PARALLEL REPEAT: {n} x count_primes({limit:,}) on {os.cpu_count()} CPU(s)")
+
+    timings = {}
+    for executor in ("serial", "thread", "process"):
+        repeated = tutorial.repeat(n, executor=executor)(count_primes)
+        repeated(1_000)  # warm up the shared pool
+        timings[executor] = _best_time(lambda: repeated(limit), 3)
+    for executor, elapsed in timings.items():
+        print(f"  {executor:>7}: {elapsed * 1000:8.1f} ms  ({timings['serial'] / elapsed:4.2f}x vs serial)")
+    tutorial.shutdown_pools()
+
+
+def bench_type_dispatch(type_counts=(2, 4, 8, 16, 32)):
+    """
+    Compare TypeDispatcher with an if/elif isinstance chain as types grow.
+
+    Args:
+        type_counts (tuple): Numbers of registered types to measure
+    """
+    tutorial = _load_tutorial()
+    _header("TYPE DISPATCH: isinstance chain vs TypeDispatcher")
+    print(f"  {'types':>5}  {'chain (first)':>14}  {'chain (last)':>14}  {'dispatcher':>14}")
+
+    for count in type_counts:
+        types = [type(f"T{i}", (), {}) for i in range(count)]
+        namespace = {f"T{i}": cls for i, cls in enumerate(types)}
+        branches = "\n".join(f"    {'if' if i == 0 else 'elif'} isinstance(value, T{i}):\n        return {i}"
+                             for i in range(count))
+        exec(f"def chain(value):\n{branches}\n    raise TypeError", namespace)
+        chain = namespace["chain"]
+
+        dispatcher = tutorial.type_dispatch(lambda value: None)
+        for i, cls in enumerate(types):
+            dispatcher.register(cls)(lambda value, i=i: i)
+
+        first, last = types[0](), types[-1]()
+        costs = [_per_call_ns(chain, first, 300_000), _per_call_ns(chain, last, 300_000),
+                 _per_call_ns(dispatcher, last, 300_000)]
+        print(f"  {count:>5}  " + "  ".join(f"{cost:11.1f} ns" for cost in costs))
+
+
+def bench_calculator_batch(n=500_000):
+    """
+    Compare per-value Calculator.process calls with process_many().
+
+    Args:
+        n (int): Number of mixed int/str values
+    """
+    tutorial = _load_tutorial()
+    _header(f"CALCULATOR BATCH: {n:,} mixed values")
+    calc = tutorial.Calculator()
+    values = [i if i % 3 else f"item{i}" for i in range(n)]
+
+    with contextlib.redirect_stdout(io.StringIO()):  # process() prints every value
+        looped = _best_time(lambda: [calc.process(value) for value in values], 3)
+        expected = [calc.process(value) for value in values]
+    batched = _best_time(lambda: calc.process_many(values), 3)
+
+    print(f"  process() per value: {looped * 1000:9.2f} ms")
+    print(f"  process_many():      {batched * 1000:9.2f} ms  ({looped / batched:.1f}x faster)")
+    print(f"  Identical results:   {calc.process_many(values) == expected}")
+
+
+# ============================================================================
+# STARTUP: cold import cost of the tutorial module
+# ============================================================================
+
+def _spawn_time(code, runs):
+    """
+    Time fresh interpreters running code and return the fastest run.
+
+    Args:
+        code (str): Source passed to python -c
+        runs (int): How many interpreters to start
+
+    Returns:
+        tuple: (best seconds, stdout of the last run)
+    """
+    import subprocess
+
+    best, output = float("inf"), ""
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        best = min(best, time.perf_counter() - start)
+        output = result.stdout
+    return best, output
+
+
+def bench_startup(runs=10):
+    """
+    Measure how much importing the tutorial adds to interpreter startup.
+
+    Args:
+        runs (int): Interpreter launches per measurement
+    """
+    _header(f"STARTUP: best of {runs} fresh interpreters")
+    bare, _ = _spawn_time("pass", runs)
+    imported, output = _spawn_time("import python_advanced_tutorial", runs)
+    examples, _ = _spawn_time("import python_advanced_tutorial as t; t.run_examples()", runs)
+
+    print(f"  Bare interpreter:        {bare * 1000:8.2f} ms")
+    print(f"  import tutorial:         {imported * 1000:8.2f} ms  (+{(imported - bare) * 1000:.2f} ms)")
+    print(f"  import + run_examples(): {examples * 1000:8.2f} ms  (+{(examples - bare) * 1000:.2f} ms)")
+    print(f"  Silent import:           {output == ''}")
+
+
+# Cold-import budget for python_advanced_tutorial, in microseconds of
+# cumulative -X importtime. Measured at ~37 ms with NumPy, asyncio and
+# concurrent.futures loaded lazily; raise it deliberately, not casually.
+IMPORT_TIME_BUDGET_US = 60_000
+
+
+def _import_time_us(module_name):
+    """
+    Measure a module's cumulative cold import time with -X importtime.
+
+    Args:
+        module_name (str): The module to import in a fresh interpreter
+
+    Returns:
+        tuple: (cumulative microseconds, [(self us, name), ...] for every
+        module the import pulled in)
+    """
+    import subprocess
+
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+                            capture_output=True, text=True, check=True)
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((int(self_us), int(cumulative_us), name.strip()))
+    total = next(cumulative for _, cumulative, name in reversed(modules) if name == module_name)
+    return total, [(self_us, name) for self_us, _, name in modules]
+
+
+def bench_import_time(runs=5, budget_us=IMPORT_TIME_BUDGET_US):
+    """
+    Check the tutorial's cold import time against the recorded budget.
+
+    Args:
+        runs (int): Fresh interpreters to measure (the best run counts)
+        budget_us (int): Allowed cumulative import time in microseconds
+
+    Returns:
+        bool: False if the import is over budget
+    """
+    _header(f"IMPORT TIME: -X importtime, best of {runs}")
+    total, modules = min(_import_time_us("python_advanced_tutorial") for _ in range(runs))
+
+    print("  Slowest modules (self time):")
+    for self_us, name in sorted(modules, reverse=True)[:5]:
+        print(f"    {self_us / 1000:7.2f} ms  {name}")
+    print(f"  Cumulative: {total / 1000:.2f} ms (budget {budget_us / 1000:.2f} ms)")
+    if total > budget_us:
+        print("  ❌ Import time is over budget!")
+        return False
+    print("  ✅ Within budget")
+    return True
+
+
+# ============================================================================
+# QUIZ: per-session footprint
+# ============================================================================
+
+def bench_quiz_sessions(n=100_000, locale_counts=(2, 10, 50)):
+    """
+    Measure Quiz session memory as the number of installed locales grows.
+
+    Each run installs copies of the English file as extra locales in a
+    temporary folder and spreads n sessions across all of them.
+
+    Args:
+        n (int): Number of concurrent sessions to create
+        locale_counts (tuple): Numbers of installed locales to try
+    """
+    import shutil
+    import tempfile
+
+    import python_advanced_quiz as quiz
+
+    _header(f"QUIZ: {n:,} concurrent sessions")
+    source = os.path.join(quiz.LOCALE_DIR, "en.json")
+    print(f"  {'locales':>7}  {'first load':>11}  {'cached load':>11}  {'per session':>12}  {'create all':>11}")
+
+    for count in locale_counts:
+        with tempfile.TemporaryDirectory() as directory:
+            for i in range(count):
+                shutil.copy(source, os.path.join(directory, f"l{i}.json"))
+            locales = quiz.available_locales(directory)
+
+            quiz.load_bank.cache_clear()
+            start = time.perf_counter()
+            quiz.load_bank(locales[0], directory)
+            first = time.perf_counter() - start
+            cached = _best_time(lambda: quiz.load_bank(locales[0], directory))
+            for locale in locales:
+                quiz.load_bank(locale, directory)
+
+            sessions = [locales[i % count] for i in range(n)]
+            session_bytes = _bytes_per_object(lambda: [quiz.Quiz(locale, directory) for locale in sessions], n)
+            created = _best_time(lambda: [quiz.Quiz(locale, directory) for locale in sessions], 3)
+
+        print(f"  {count:>7}  {first * 1000:8.2f} ms  {cached * 1e6:8.2f} us  "
+              f"{session_bytes:6.1f} bytes  {created * 1000:8.2f} ms")
+    quiz.load_bank.cache_clear()
+
+
+def bench_quiz_server(client_counts=(100, 1000, 2000)):
+    """
+    Load-test the asyncio quiz server with many simulated learners.
+
+    Args:
+        client_counts (tuple): Numbers of concurrent learners to try
+    """
+    import asyncio
+
+    import python_advanced_quiz_server as server
+
+    _header("QUIZ SERVER: concurrent sessions in one event loop")
+    for clients in client_counts:
+        print(f"  {clients:,} learners:")
+        server.print_report(asyncio.run(server.load_test(clients)))
+
+
+def bench_batch_grader(n=200_000):
+    """
+    Compare grading sheets through Quiz.check_answer with the batch grader.
+
+    Args:
+        n (int): Number of answer sheets
+    """
+    import random
+
+    import python_advanced_quiz as quiz
+    import python_advanced_quiz_grader as grader
+
+    _header(f"BATCH GRADER: {n:,} answer sheets")
+    rng = random.Random(0)
+    questions = quiz.load_bank().questions
+    sheets = [{"user": i, "answers": [rng.choice("abcd") for _ in questions]} for i in range(n)]
+
+    def interactive():
+        scores = []
+        for sheet in sheets:
+            session = quiz.Quiz()
+            session.output = io.StringIO()
+            for answer, question_data in zip(sheet["answers"], questions):
+                session.check_answer(session.parse_answer(answer) or "", question_data)
+            scores.append(session.score)
+        return scores
+
+    looped = _best_time(interactive, 1)
+    batched = _best_time(lambda: grader.grade_sheets(sheets), 3)
+    report = grader.grade_sheets(sheets)
+
+    print(f"  Quiz.check_answer loop: {looped * 1000:9.2f} ms")
+    print(f"  grade_sheets():         {batched * 1000:9.2f} ms  ({looped / batched:.1f}x faster)")
+    print(f"  Identical scores:       {report.scores.tolist() == interactive()}")
+
+
+def bench_quiz_analytics(n=200_000, workers=4):
+    """
+    Measure QuizAnalytics update and merge costs.
+
+    Args:
+        n (int): Number of answers to record
+        workers (int): Number of per-worker counters to merge
+    """
+    import random
+
+    import python_advanced_quiz_analytics as analytics
+
+    _header(f"QUIZ ANALYTICS: {n:,} answers")
+    rng = random.Random(0)
+    counts = analytics.QuizAnalytics()
+    answers = [(rng.choice(counts.questions), rng.choice("abcdx")) for _ in range(n)]
+
+    def record():
+        record_answer = counts.record_answer
+        for question_data, answer in answers:
+            record_answer(question_data, answer)
+
+    per_answer = _best_time(record, 3) / n
+    parts = [analytics.QuizAnalytics() for _ in range(workers)]
+    for i, (question_data, answer) in enumerate(answers):
+        parts[i % workers].record_answer(question_data, answer)
+    merged = _best_time(lambda: sum(parts[1:], parts[0]))
+    whole = analytics.QuizAnalytics()
+    for question_data, answer in answers:
+        whole.record_answer(question_data, answer)
+
+    print(f"  record_answer():        {per_answer * 1e9:8.1f} ns/answer")
+    print(f"  Merge {workers} workers:        {merged * 1e6:8.1f} us")
+    print(f"  Merged == single pass:  {sum(parts[1:], parts[0]).to_dict() == whole.to_dict()}")
+
+
+def _rss_bytes():
+    """
+    Return the current resident set size of this process.
+
+    Returns:
+        int: RSS in bytes (peak RSS where /proc is unavailable)
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def bench_quiz_soak(attempts=10_000, samples=10, tolerance=1024 * 1024):
+    """
+    Soak-test the quiz's retry loop and check that RSS stays flat.
+
+    Drives main() through `attempts` retries with scripted input and
+    silenced output, sampling RSS as it goes.
+
+    Args:
+        attempts (int): Number of quiz attempts (retries + 1)
+        samples (int): How many RSS samples to take
+        tolerance (int): Allowed RSS growth in bytes after the first sample
+
+    Returns:
+        bool: False if RSS grew by more than the tolerance
+    """
+    import builtins
+
+    import python_advanced_quiz as quiz
+
+    _header(f"QUIZ SOAK: {attempts:,} attempts through main()")
+    messages = quiz.load_bank().messages
+    finished = 0
+    rss = []
+
+    def scripted_input(prompt=""):
+        nonlocal finished
+        if prompt == messages["answer_prompt"]:
+            return "b"
+        if prompt == messages["retry_prompt"]:
+            finished += 1
+            if finished % (attempts // samples) == 0:
+                rss.append(_rss_bytes())
+            return messages["retry_answer"] if finished < attempts else "no"
+        return ""
+
+    original_input = builtins.input
+    builtins.input = scripted_input
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            quiz.main()
+            elapsed = time.perf_counter() - start
+    finally:
+        builtins.input = original_input
+
+    growth = rss[-1] - rss[0]
+    print(f"  Attempts:   {finished:,} in {elapsed:.2f}s")
+    print(f"  RSS:        " + ", ".join(f"{value / 2**20:.1f}" for value in rss) + " MiB")
+    print(f"  Growth:     {growth / 1024:+.0f} KiB (tolerance {tolerance / 1024:.0f} KiB)")
+    if growth > tolerance:
+        print("  ❌ Memory grows with every retry!")
+        return False
+    print("  ✅ Memory is flat")
+    return True
+
+
+class _CountingRaw(io.RawIOBase):
+    """A sink that counts its write() calls - one per write(2) syscall on a real fd."""
+
+    def __init__(self):
+        self.writes = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.writes += 1
+        return len(data)
+
+
+def bench_quiz_render(n=2_000):
+    """
+    Count output syscalls per question, line-by-line vs buffered screens.
+
+    Output goes through a line-buffered text stream, like stdout on a
+    terminal, so every print() that ends a line costs one write(2). The
+    line-by-line run prints the same text the way the quiz used to, one
+    print() per line.
+
+    Args:
+        n (int): Number of questions to render per run
+    """
+    import python_advanced_quiz as quiz
+
+    _header(f"QUIZ RENDER: {n:,} question screens + feedback")
+    session = quiz.Quiz()
+    questions = [session.questions[i % len(session.questions)] for i in range(n)]
+
+    def line_by_line(stream):
+        for i, question_data in enumerate(questions, 1):
+            screen = session.render_question(i, question_data)
+            for line in screen[:-1].split("\n"):
+                print(line, file=stream)
+            print(file=stream)
+            print(f"✅ {session.message('correct')}", file=stream)
+            print(f"💡 {session.message('explanation', explanation=question_data.explanation)}", file=stream)
+
+    def buffered(stream):
+        session.output = stream
+        for i, question_data in enumerate(questions, 1):
+            session.display_question(i, question_data)
+            session.check_answer(question_data.correct, question_data)
+
+    def measure(render):
+        raw = _CountingRaw()
+        stream = io.TextIOWrapper(io.BufferedWriter(raw), encoding="utf-8", line_buffering=True)
+        start = time.perf_counter()
+        render(stream)
+        elapsed = time.perf_counter() - start
+        return raw.writes / n, elapsed / n
+
+    print(f"  {'rendering':<26} {'syscalls/question':>17}  {'time/question':>13}")
+    runs = [("print() per line", line_by_line), ("one write per screen", buffered)]
+    for label, render in runs:
+        syscalls, per_question = measure(render)
+        print(f"  {label:<26} {syscalls:17.1f}  {per_question * 1e6:10.2f} us")
+
+    quiz.Quiz.screen_cache = quiz.ScreenCache()
+    try:
+        quiz.Quiz.screen_cache.precompute()
+        syscalls, per_question = measure(buffered)
+        print(f"  {'  + precomputed screens':<26} {syscalls:17.1f}  {per_question * 1e6:10.2f} us")
+    finally:
+        quiz.Quiz.screen_cache = None
+
+
+def bench_quiz_sampling(n=200_000, k=20, topics=25, draws=1_000):
+    """
+    Draw k questions from a large bank, vs shuffling a copy of it.
+
+    Builds a synthetic bank of n questions spread over `topics` topics in a
+    temporary folder, then compares per-draw time and peak memory.
+
+    Args:
+        n (int): Number of questions in the bank
+        k (int): Questions drawn per learner
+        topics (int): Number of topics in the bank
+        draws (int): Number of draws to time
+    """
+    import json
+    import random
+    import tempfile
+    import tracemalloc
+
+    import python_advanced_quiz as quiz
+
+    _header(f"QUIZ SAMPLING: {k} of {n:,} questions")
+    with open(os.path.join(quiz.LOCALE_DIR, "en.json"), encoding="utf-8") as file:
+        template = json.load(file)
+    item = template["questions"][0]
+    template["questions"] = [dict(item, question=f"Question #{i}", topic=f"topic{i % topics}") for i in range(n)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, "big.json"), "w", encoding="utf-8") as file:
+            json.dump(template, file)
+        start = time.perf_counter()
+        bank = quiz.load_bank("big", directory)
+        loaded = time.perf_counter() - start
+    quiz.load_bank.cache_clear()
+    print(f"  Load + topic index:  {loaded * 1000:8.1f} ms")
+
+    def shuffled(seed):
+        questions = list(bank.questions)
+        random.Random(seed).shuffle(questions)
+        return tuple(questions[:k])
+
+    runs = [
+        ("shuffle a copy", shuffled),
+        ("sample_questions()", lambda seed: quiz.sample_questions(bank, k, seed)),
+        ("  by_topic=True", lambda seed: quiz.sample_questions(bank, k, seed, by_topic=True)),
+    ]
+    print(f"  {'draw':<20} {'time/draw':>12}  {'peak memory':>12}")
+    for label, draw in runs:
+        repeat = draws if draw is not shuffled else max(1, draws // 100)
+        per_draw = _best_time(lambda: [draw(seed) for seed in range(repeat)], 3) / repeat
+        tracemalloc.start()
+        draw(0)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  {label:<20} {per_draw * 1e6:9.1f} us  {peak / 1024:9.1f} KiB")
+
+    same = quiz.sample_questions(bank, k, 42, by_topic=True) == quiz.sample_questions(bank, k, 42, by_topic=True)
+    print(f"  Same seed, same questions: {same}")
+
+
+def bench_pizza_counter(threads=32, per_thread=20_000):
+    """
+    Stress-test Pizza.total_pizzas_made from many threads and compare the
+    sharded counter's throughput with a lock and with a plain `+= 1`.
+
+    Args:
+        threads (int): Number of threads building pizzas at once
+        per_thread (int): Pizzas (or increments) per thread
+
+    Returns:
+        bool: False if the sharded counter lost any update
+    """
+    import threading
+
+    tutorial = _load_tutorial()
+    Pizza = tutorial.Pizza
+
+    _header(f"PIZZA COUNTER: {threads} threads x {per_thread:,} pizzas")
+
+    def hammer(work):
+        """Run work() in every thread at once; return the elapsed seconds."""
+        barrier = threading.Barrier(threads + 1)
+
+        def worker():
+            barrier.wait()
+            work()
+
+        pool = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in pool:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in pool:
+            thread.join()
+        return time.perf_counter() - start
+
+    before = Pizza.get_total_pizzas()
+    elapsed = hammer(lambda: [Pizza.margherita() for _ in range(per_thread)])
+    made = Pizza.get_total_pizzas() - before
+    expected = threads * per_thread
+    print(f"  Pizzas built: {made:,} of {expected:,} counted in {elapsed:.2f}s")
+
+    class Plain:
+        count = 0
+
+    def plain():
+        for _ in range(per_thread):
+            Plain.count += 1
+
+    lock = threading.Lock()
+
+    def locked():
+        for _ in range(per_thread):
+            with lock:
+                Plain.count += 1
+
+    sharded = tutorial.ShardedCounter()
+
+    def sharded_add():
+        add = sharded.add
+        for _ in range(per_thread):
+            add()
+
+    print(f"  {'counter':<16} {'increments/s':>14}  {'lost':>8}")
+    for label, work, read in [("plain += 1", plain, lambda: Plain.count),
+                              ("threading.Lock", locked, lambda: Plain.count),
+                              ("ShardedCounter", sharded_add, lambda: sharded.value)]:
+        Plain.count = 0
+        start_value = read()
+        elapsed = hammer(work)
+        lost = expected - (read() - start_value)
+        print(f"  {label:<16} {expected / elapsed:14,.0f}  {lost:8,}")
+
+    if made != expected or sharded.value != expected:
+        print("  ❌ Sharded counter lost updates!")
+        return False
+    print("  ✅ No updates lost")
+    return True
+
+
+def bench_pizza_flyweight(n=1_000_000):
+    """
+    Compare memory and build time of flyweight pizzas with pizzas that each
+    own a fresh ingredient list (how Pizza used to work).
+
+    Args:
+        n (int): Number of pizzas to build
+    """
+    tutorial = _load_tutorial()
+    Pizza = tutorial.Pizza
+
+    class ListPizza:
+        """The previous Pizza: a __dict__ and a new list per pizza."""
+
+        def __init__(self, ingredients):
+            self.ingredients = ingredients
+
+        def __repr__(self):
+            return f"Pizza({', '.join(self.ingredients)})"
+
+        @classmethod
+        def margherita(cls):
+            return cls(['tomato sauce', 'mozzarella', 'basil'])
+
+    _header(f"PIZZA FLYWEIGHT: {n:,} margheritas")
+    before = Pizza.get_total_pizzas()
+    list_bytes = _bytes_per_object(lambda: [ListPizza.margherita() for _ in range(n)], n)
+    flyweight_bytes = _bytes_per_object(lambda: [Pizza.margherita() for _ in range(n)], n)
+    counted = Pizza.get_total_pizzas() - before
+
+    repeat = n // 10
+    list_time = _best_time(lambda: [ListPizza.margherita() for _ in range(repeat)], 3) / repeat
+    flyweight_time = _best_time(lambda: [Pizza.margherita() for _ in range(repeat)], 3) / repeat
+    pizza, old = Pizza.margherita(), ListPizza.margherita()
+    repr_time = _best_time(lambda: [repr(pizza) for _ in range(repeat)], 3) / repeat
+    old_repr_time = _best_time(lambda: [repr(old) for _ in range(repeat)], 3) / repeat
+
+    print(f"  {'':<20} {'memory/pizza':>12}  {'build':>10}  {'repr':>10}")
+    print(f"  {'list per pizza':<20} {list_bytes:6.1f} bytes  {list_time * 1e9:7.1f} ns  {old_repr_time * 1e9:7.1f} ns")
+    print(f"  {'flyweight':<20} {flyweight_bytes:6.1f} bytes  {flyweight_time * 1e9:7.1f} ns  {repr_time * 1e9:7.1f} ns")
+    print(f"  Total at {n:,}: {list_bytes * n / 2**20:.0f} MiB -> {flyweight_bytes * n / 2**20:.0f} MiB")
+    print(f"  get_total_pizzas() counted {counted:,} of {n:,}")
+
+
+def bench_pizza_bulk(n=500_000):
+    """
+    Compare building an order batch in a loop with Pizza.bulk() and
+    Pizza.from_orders().
+
+    Args:
+        n (int): Number of pizzas per batch
+    """
+    tutorial = _load_tutorial()
+    Pizza = tutorial.Pizza
+
+    _header(f"PIZZA BULK: batches of {n:,} pizzas")
+    menu = ["margherita", "pepperoni", ["tomato sauce", "mozzarella", "ham"]]
+
+    def orders():
+        """A stream of orders, generated one at a time."""
+        return (menu[i % len(menu)] for i in range(n))
+
+    runs = [
+        ("loop: Pizza.margherita()", lambda: [Pizza.margherita() for _ in range(n)]),
+        ("Pizza.bulk()", lambda: Pizza.bulk("margherita", n)),
+        ("loop: Pizza(order)", lambda: [Pizza(order) for order in orders()]),
+        ("Pizza.from_orders()", lambda: Pizza.from_orders(orders())),
+    ]
+    before = Pizza.get_total_pizzas()
+    for label, build in runs:
+        elapsed = _best_time(build, 3)
+        print(f"  {label:<26} {n / elapsed:12,.0f} pizzas/s")
+    print(f"  Every pizza counted: {Pizza.get_total_pizzas() - before == len(runs) * 3 * n}")
+
+
+def bench_pizza_registry(recipes=5_000, calls=200_000):
+    """
+    Load a recipe catalog lazily, from JSON and from its on-disk cache, and
+    time generated Pizza.<name>() factories.
+
+    Args:
+        recipes (int): Number of recipes in the synthetic catalog
+        calls (int): Factory calls to time
+    """
+    import json
+    import tempfile
+
+    tutorial = _load_tutorial()
+
+    class CatalogPizza(tutorial.Pizza):
+        __slots__ = ()
+        recipes = tutorial.RecipeRegistry()
+
+    _header(f"PIZZA REGISTRY: catalog of {recipes:,} recipes")
+    toppings = [f"topping {i}" for i in range(200)]
+    catalog = {f"recipe_{i}": ["tomato sauce", "mozzarella", toppings[i % 200], toppings[i * 7 % 200]]
+               for i in range(recipes)}
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "catalog.json")
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(catalog, file)
+
+        start = time.perf_counter()
+        CatalogPizza.recipes.add_catalog(path)
+        added = time.perf_counter() - start
+        start = time.perf_counter()
+        CatalogPizza.recipes.get(f"recipe_{recipes - 1}")
+        parsed = time.perf_counter() - start
+
+        def cached_load():
+            registry = tutorial.RecipeRegistry()
+            registry.add_catalog(path)
+            registry.get("recipe_0")
+
+        cached = _best_time(cached_load)
+        json_size = os.path.getsize(path)
+        cache_size = os.path.getsize(path + ".cache")
+
+    last = f"recipe_{recipes - 1}"
+    getattr(CatalogPizza, last)()  # Generate the factory
+    factory = _best_time(lambda: [getattr(CatalogPizza, last)() for _ in range(calls)], 3) / calls
+    by_name = _best_time(lambda: [CatalogPizza.from_recipe(last) for _ in range(calls)], 3) / calls
+    listed = _best_time(lambda: [tutorial.Pizza(catalog[last]) for _ in range(calls)], 3) / calls
+
+    print(f"  add_catalog():             {added * 1e6:8.1f} us  (nothing read yet)")
+    print(f"  First lookup, parse JSON:  {parsed * 1000:8.2f} ms  ({json_size / 1024:.0f} KiB)")
+    print(f"  First lookup, disk cache:  {cached * 1000:8.2f} ms  ({cache_size / 1024:.0f} KiB)")
+    print(f"  Pizza.{last}():     {factory * 1e9:8.1f} ns")
+    print(f"  Pizza.from_recipe(name):   {by_name * 1e9:8.1f} ns")
+    print(f"  Pizza(ingredients):        {listed * 1e9:8.1f} ns")
+
+
+def bench_sealed_animals(n=1_000_000):
+    """
+    Compare instantiation and isinstance() cost of the ABC-based Animal
+    hierarchy and the sealed one.
+
+    Args:
+        n (int): Number of operations to time
+    """
+    tutorial = _load_tutorial()
+    _header(f"SEALED ANIMALS: {n:,} operations")
+
+    dog, sealed_dog, stranger = tutorial.Dog("Rex"), tutorial.SealedDog("Rex"), object()
+    Animal, SealedAnimal = tutorial.Animal, tutorial.SealedAnimal
+    runs = [
+        ("instantiate a dog", lambda: [tutorial.Dog("Rex") for _ in range(n)],
+         lambda: [tutorial.SealedDog("Rex") for _ in range(n)]),
+        ("isinstance(dog, ...)", lambda: [isinstance(dog, Animal) for _ in range(n)],
+         lambda: [isinstance(sealed_dog, SealedAnimal) for _ in range(n)]),
+        ("isinstance(other, ...)", lambda: [isinstance(stranger, Animal) for _ in range(n)],
+         lambda: [isinstance(stranger, SealedAnimal) for _ in range(n)]),
+        ("type(dog) in subclasses", None,
+         lambda: [type(sealed_dog) in SealedAnimal.subclasses for _ in range(n)]),
+    ]
+    print(f"  {'operation':<24} {'ABCMeta':>10}  {'Sealed':>10}")
+    for label, abc_run, sealed_run in runs:
+        sealed_time = _best_time(sealed_run, 3) / n
+        if abc_run is None:
+            print(f"  {label:<24} {'-':>10}  {sealed_time * 1e9:7.1f} ns")
+            continue
+        abc_time = _best_time(abc_run, 3) / n
+        print(f"  {label:<24} {abc_time * 1e9:7.1f} ns  {sealed_time * 1e9:7.1f} ns  ({abc_time / sealed_time:.1f}x)")
+
+
+BENCHMARKS = {
+    "shapes": bench_shapes,
+    "person": bench_person,
+    "person_table": bench_person_table,
+    "decorators": bench_decorators,
+    "decorator_stacks": bench_decorator_stacks,
+    "memoize": bench_memoize,
+    "async_repeat": bench_async_repeat,
+    "parallel_repeat": bench_parallel_repeat,
+    "type_dispatch": bench_type_dispatch,
+    "calculator_batch": bench_calculator_batch,
+    "startup": bench_startup,
+    "import_time": bench_import_time,
+    "quiz_sessions": bench_quiz_sessions,
+    "quiz_server": bench_quiz_server,
+    "batch_grader": bench_batch_grader,
+    "quiz_analytics": bench_quiz_analytics,
+    "quiz_soak": bench_quiz_soak,
+    "quiz_render": bench_quiz_render,
+    "quiz_sampling": bench_quiz_sampling,
+    "pizza_counter": bench_pizza_counter,
+    "pizza_flyweight": bench_pizza_flyweight,
+    "pizza_bulk": bench_pizza_bulk,
+    "pizza_registry": bench_pizza_registry,
+    "sealed_animals": bench_sealed_animals,
+}
+
+
+def main(argv=None):
+    """
+    Run the selected benchmarks (all of them by default).
+
+    Exits with status 1 if a benchmark that checks a budget fails.
+
+    Args:
+        argv (list): Benchmark names; defaults to sys.argv[1:]
+    """
+    names = (sys.argv[1:] if argv is None else argv) or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        print(f"❌ Unknown benchmark(s): {', '.join(unknown)}")
+        print(f"   Available: {', '.join(BENCHMARKS)}")
+        sys.exit(1)
+    failed = [name for name in names if BENCHMARKS[name]() is False]
+    if failed:
+        print(f"\n❌ Failed: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,157 +5,371 @@ PYTHON ADVANCED FEATURES QUIZ
 This quiz tests your understanding of Python decorators and advanced features.
 Answer each question by typing the letter (a, b, c, or d) of your choice.
 
+The questions and messages for each language live in quiz_locales/<locale>.json,
+so adding a language only takes a new data file:
+
+    python python_advanced_quiz.py        # English
+    python python_advanced_quiz.py tr     # Turkish
+    python python_advanced_quiz.py en 5   # 5 random questions, spread across topics
+
 Good luck! 🎓
 """
 
+import json
+import os
+import random
 import sys
+from collections import namedtuple
+from functools import lru_cache
+
+
+# A question record. options is a tuple of (letter, text) pairs, in display
+# order; topic is an optional tag such as 'property'. Records are immutable,
+# so every session can share them.
+Question = namedtuple("Question", "question options correct explanation topic", defaults=(None,))
+
+# A parsed locale file: its UI messages, its tuple of Questions, and a topic
+# index mapping each topic to the (ascending) positions of its questions
+QuestionBank = namedtuple("QuestionBank", "locale messages questions topics")
+
+LOCALE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "quiz_locales")
+DEFAULT_LOCALE = "en"
+SCREEN_WIDTH = 70  # Width of the ===== rules around each screen
+
+# Score thresholds (percent) for each feedback message, checked in order
+FEEDBACK_BANDS = (
+    (100, "perfect"),
+    (80, "excellent"),
+    (60, "good"),
+    (40, "keep_learning"),
+    (0, "dont_give_up"),
+)
+
+
+def feedback_band(percentage):
+    """
+    Pick the feedback message for a score.
+
+    Args:
+        percentage (float): The score as a percentage (0-100)
+
+    Returns:
+        str: The band's message key, e.g. 'excellent'
+    """
+    return next(name for threshold, name in FEEDBACK_BANDS if percentage >= threshold)
+
+
+def available_locales(directory=LOCALE_DIR):
+    """
+    List the locales that have a question file.
+
+    Args:
+        directory (str): Folder containing <locale>.json files
+
+    Returns:
+        list: Sorted locale names, e.g. ['en', 'tr']
+    """
+    return sorted(name[:-len(".json")] for name in os.listdir(directory) if name.endswith(".json"))
+
+
+def load_bank(locale=DEFAULT_LOCALE, directory=LOCALE_DIR):
+    """
+    Load and validate the question bank for a locale.
+
+    The file is parsed once; later calls return the same cached, immutable
+    QuestionBank, so every session in every language shares it read-only.
+    Locales that are never requested are never read. The directory is
+    normalized first, so load_bank('en') and load_bank('en', LOCALE_DIR)
+    share one bank.
+
+    Args:
+        locale (str): Locale name, e.g. 'en' or 'tr'
+        directory (str): Folder containing <locale>.json files
+
+    Returns:
+        QuestionBank: The locale's messages and questions
+
+    Raises:
+        FileNotFoundError: If there is no file for the locale
+        ValueError: If the file is missing messages or has a malformed question
+    """
+    return _load_bank(locale, os.path.abspath(directory))
+
+
+@lru_cache(maxsize=None)
+def _load_bank(locale, directory):
+    """Parse and validate <directory>/<locale>.json (see load_bank)."""
+    path = os.path.join(directory, f"{locale}.json")
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+
+    messages = data["messages"]
+    missing = [key for _, key in FEEDBACK_BANDS if key not in messages.get("feedback", {})]
+    if missing:
+        raise ValueError(f"{path}: missing feedback messages {missing}")
+
+    questions = []
+    topics = {}
+    for number, item in enumerate(data["questions"], 1):
+        options = tuple(sorted(item["options"].items()))
+        if [letter for letter, _ in options] != ["a", "b", "c", "d"] or item["correct"] not in item["options"]:
+            raise ValueError(f"{path}: question {number} needs options a-d and a correct answer among them")
+        topic = item.get("topic")
+        questions.append(Question(item["question"], options, item["correct"], item["explanation"], topic))
+        topics.setdefault(topic, []).append(number - 1)
+    topics = {topic: tuple(positions) for topic, positions in topics.items()}
+    return QuestionBank(locale, messages, tuple(questions), topics)
+
+
+load_bank.cache_info = _load_bank.cache_info
+load_bank.cache_clear = _load_bank.cache_clear
+
+
+def sample_questions(bank, k, seed=None, by_topic=False):
+    """
+    Draw k different questions from a bank at random.
+
+    Only the k chosen positions are drawn - the bank is never copied or
+    shuffled - so the cost depends on k, not on the size of the bank. The
+    same seed always draws the same questions.
+
+    With by_topic, every topic gets a share of the k questions proportional
+    to its size in the bank (using the bank's topic index), so small topics
+    aren't crowded out by large ones.
+
+    Args:
+        bank (QuestionBank): The questions to draw from
+        k (int): Number of questions to draw
+        seed: Seed for the random draw (int, str, ...), or a random.Random
+            to draw from; None picks a fresh random sample
+        by_topic (bool): Stratify the draw by topic
+
+    Returns:
+        tuple: The chosen Questions, in random order
+
+    Raises:
+        ValueError: If k is negative or larger than the bank
+    """
+    rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+    total = len(bank.questions)
+    if not 0 <= k <= total:
+        raise ValueError(f"Can't draw {k} questions from a bank of {total}!")
+    if not by_topic:
+        return tuple(bank.questions[i] for i in rng.sample(range(total), k))
+
+    # Largest-remainder split of k across topics, in proportion to their size
+    topics = sorted(bank.topics.items(), key=lambda item: str(item[0]))
+    shares = [(k * len(positions) // total, k * len(positions) % total) for _, positions in topics]
+    counts = [share for share, _ in shares]
+    by_remainder = sorted(range(len(topics)), key=lambda i: shares[i][1], reverse=True)
+    for i in by_remainder[:k - sum(counts)]:
+        counts[i] += 1
+
+    chosen = [bank.questions[position]
+              for (_, positions), count in zip(topics, counts)
+              for position in rng.sample(positions, count)]
+    rng.shuffle(chosen)  # Mix the topics; only the k chosen questions move
+    return tuple(chosen)
+
+
+def render_question(bank, width, question_num, total, question_data):
+    """
+    Compose the screen for a single question with its options.
+
+    Args:
+        bank (QuestionBank): The locale's messages and questions
+        width (int): Terminal width to render for
+        question_num (int): The question number
+        total (int): Number of questions in the quiz
+        question_data (Question): The question to display
+
+    Returns:
+        str: The complete screen text, ending in a newline
+    """
+    rule = "=" * width
+    lines = ["", rule, bank.messages["question_header"].format(number=question_num, total=total), rule,
+             "", question_data.question, ""]
+    lines.extend(f"  {option}) {text}" for option, text in question_data.options)
+    lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+class ScreenCache:
+    """
+    Precomputed question screens, shared by every session that uses it.
+
+    A question screen depends only on the locale, the terminal width, the
+    question and where it appears in the quiz, so it can be rendered once
+    and reused. Attach one to all sessions with `Quiz.screen_cache = ScreenCache()`.
+    """
+
+    def __init__(self, maxsize=4096):
+        """
+        Start with no screens.
+
+        Args:
+            maxsize (int): Most screens to keep; the oldest is dropped first
+        """
+        self.maxsize = maxsize
+        self._screens = {}
+
+    def __len__(self):
+        return len(self._screens)
+
+    def question(self, bank, width, question_num, total, question_data):
+        """
+        Return a question screen, rendering it on first use.
+
+        Args:
+            bank (QuestionBank): The locale's messages and questions
+            width (int): Terminal width to render for
+            question_num (int): The question number
+            total (int): Number of questions in the quiz
+            question_data (Question): The question to display
+
+        Returns:
+            str: The complete screen text
+        """
+        key = (bank.locale, width, question_num, total, question_data)
+        screen = self._screens.get(key)
+        if screen is None:
+            if len(self._screens) >= self.maxsize:
+                del self._screens[next(iter(self._screens))]
+            screen = self._screens[key] = render_question(bank, width, question_num, total, question_data)
+        return screen
+
+    def precompute(self, locale=DEFAULT_LOCALE, width=SCREEN_WIDTH):
+        """
+        Render every question screen of a locale ahead of time.
+
+        Args:
+            locale (str): Which question bank to render
+            width (int): Terminal width to render for
+        """
+        bank = load_bank(locale)
+        for i, question_data in enumerate(bank.questions, 1):
+            self.question(bank, width, i, len(bank.questions), question_data)
+
+    def clear(self):
+        """Drop every screen, e.g. after a locale file changed."""
+        self._screens.clear()
 
 
 class Quiz:
-    """A simple quiz application for testing Python knowledge."""
+    """
+    A simple quiz application for testing Python knowledge.
+
+    The questions and messages come from the shared, cached QuestionBank
+    of the chosen locale, so a Quiz only holds its own session state: the
+    score and how far it has got. Its size doesn't depend on how many
+    questions or locales there are.
+    """
+
+    __slots__ = ("bank", "score", "total_questions", "current", "output", "analytics", "width", "selection")
+
+    screen_cache = None  # Optional ScreenCache shared by every session
     
-    def __init__(self):
-        """Initialize the quiz with questions and track score."""
+    def __init__(self, locale=DEFAULT_LOCALE, directory=LOCALE_DIR, width=SCREEN_WIDTH):
+        """
+        Initialize a quiz session with an empty score.
+
+        Args:
+            locale (str): Which question file to use, e.g. 'en' or 'tr'
+            directory (str): Folder containing <locale>.json files
+            width (int): Terminal width the screens are drawn for
+        """
+        self.bank = load_bank(locale, directory)
+        self.width = width
         self.score = 0
         self.total_questions = 0
-        self.questions = self.create_questions()
-    
-    def create_questions(self):
+        self.current = 0  # Number of questions answered so far
+        self.output = None  # Where to print; None means sys.stdout
+        self.analytics = None  # Optional shared QuizAnalytics to count answers in
+        self.selection = None  # Questions drawn by sample(); None asks the whole bank
+
+    @property
+    def questions(self):
+        """tuple: The questions this session asks - the whole bank unless sampled."""
+        return self.bank.questions if self.selection is None else self.selection
+
+    def sample(self, k, seed=None, by_topic=False):
         """
-        Create the quiz questions.
-        
+        Ask only k randomly drawn questions from now on.
+
+        Args:
+            k (int): Number of questions, or None to ask the whole bank again
+            seed: Seed for a reproducible draw (see sample_questions())
+            by_topic (bool): Stratify the draw by topic
+        """
+        self.selection = None if k is None else sample_questions(self.bank, k, seed, by_topic)
+
+    def message(self, key, **values):
+        """
+        Look up a UI message in this session's locale.
+
+        Args:
+            key (str): The message name in the locale file
+            **values: Values for the message's {placeholders}
+
         Returns:
-            list: List of question dictionaries
+            str: The formatted message
         """
-        return [
-            {
-                "question": "What is the main purpose of a decorator in Python?",
-                "options": {
-                    "a": "To delete functions",
-                    "b": "To modify or extend the behavior of functions without changing their code",
-                    "c": "To create new classes",
-                    "d": "To import modules"
-                },
-                "correct": "b",
-                "explanation": "Decorators wrap functions to add functionality without modifying the original function code."
-            },
-            {
-                "question": "Which decorator allows you to call a method without parentheses (person.name instead of person.name())?",
-                "options": {
-                    "a": "@staticmethod",
-                    "b": "@classmethod",
-                    "c": "@property",
-                    "d": "@abstractmethod"
-                },
-                "correct": "c",
-                "explanation": "@property allows you to call a method without parentheses, making it accessible like an attribute."
-            },
-            {
-                "question": "What is the first parameter of a @classmethod?",
-                "options": {
-                    "a": "self",
-                    "b": "cls",
-                    "c": "class",
-                    "d": "instance"
-                },
-                "correct": "b",
-                "explanation": "@classmethod receives 'cls' (the class itself) as the first parameter, not 'self' (instance)."
-            },
-            {
-                "question": "When should you use @staticmethod?",
-                "options": {
-                    "a": "When you need to access instance variables",
-                    "b": "When you need to modify class variables",
-                    "c": "When you need a utility function that doesn't access instance or class data",
-                    "d": "When you want to create abstract methods"
-                },
-                "correct": "c",
-                "explanation": "@staticmethod is for utility functions that don't need access to self or cls."
-            },
-            {
-                "question": "What happens if you try to instantiate a class with @abstractmethod methods?",
-                "options": {
-                    "a": "It works fine",
-                    "b": "Python raises a TypeError",
-                    "c": "The abstract methods are automatically implemented",
-                    "d": "The class becomes final"
-                },
-                "correct": "b",
-                "explanation": "You cannot instantiate a class that has unimplemented abstract methods - Python raises TypeError."
-            },
-            {
-                "question": "What is the purpose of @property with @setter?",
-                "options": {
-                    "a": "To make variables constant",
-                    "b": "To add validation logic when setting attribute values",
-                    "c": "To delete attributes",
-                    "d": "To create static methods"
-                },
-                "correct": "b",
-                "explanation": "@setter allows you to add validation and logic when assigning values to properties."
-            },
-            {
-                "question": "In which order are stacked decorators applied?\n\n@decorator1\n@decorator2\ndef func():\n    pass",
-                "options": {
-                    "a": "decorator1 first, then decorator2",
-                    "b": "decorator2 first, then decorator1",
-                    "c": "They are applied simultaneously",
-                    "d": "Only the top decorator is applied"
-                },
-                "correct": "b",
-                "explanation": "Decorators are applied bottom-up: the decorator closest to the function is applied first."
-            },
-            {
-                "question": "What does the @final decorator indicate?",
-                "options": {
-                    "a": "The method or class should not be overridden/subclassed",
-                    "b": "The method is the last one in the class",
-                    "c": "The class is complete and ready to use",
-                    "d": "The method will be called last"
-                },
-                "correct": "a",
-                "explanation": "@final indicates that a method should not be overridden or a class should not be subclassed."
-            },
-            {
-                "question": "What is a common use case for @classmethod?",
-                "options": {
-                    "a": "Creating utility functions",
-                    "b": "Creating alternative constructors (factory methods)",
-                    "c": "Making methods private",
-                    "d": "Preventing inheritance"
-                },
-                "correct": "b",
-                "explanation": "@classmethod is commonly used for alternative constructors like Date.from_string()."
-            },
-            {
-                "question": "What does the @override decorator help with?",
-                "options": {
-                    "a": "It makes methods run faster",
-                    "b": "It prevents methods from being called",
-                    "c": "It helps catch errors when you think you're overriding a parent method but aren't",
-                    "d": "It automatically implements abstract methods"
-                },
-                "correct": "c",
-                "explanation": "@override explicitly marks that you're overriding a parent method, helping type checkers catch mistakes."
-            }
-        ]
+        return self.bank.messages[key].format(**values)
     
+    def render_question(self, question_num, question_data):
+        """
+        Compose the screen for a single question with its options.
+
+        If a ScreenCache is attached, the screen is built once per locale,
+        width and question position and reused by every later session.
+
+        Args:
+            question_num (int): The question number
+            question_data (Question): The question to display
+
+        Returns:
+            str: The complete screen text
+        """
+        if self.screen_cache is not None:
+            return self.screen_cache.question(self.bank, self.width, question_num, len(self.questions), question_data)
+        return render_question(self.bank, self.width, question_num, len(self.questions), question_data)
+
+    def write(self, text):
+        """
+        Send one composed screen to the output in a single write.
+
+        Args:
+            text (str): The text to show
+        """
+        output = sys.stdout if self.output is None else self.output
+        output.write(text)
+        output.flush()
+
     def display_question(self, question_num, question_data):
         """
         Display a single question with its options.
         
         Args:
             question_num (int): The question number
-            question_data (dict): Dictionary containing question details
+            question_data (Question): The question to display
+        """
+        self.write(self.render_question(question_num, question_data))
+    
+    def parse_answer(self, text):
         """
-        print(f"\n{'='*70}")
-        print(f"Question {question_num}/{len(self.questions)}")
-        print(f"{'='*70}")
-        print(f"\n{question_data['question']}\n")
+        Normalize a typed answer, complaining if it isn't a valid option.
         
-        for option, text in sorted(question_data['options'].items()):
-            print(f"  {option}) {text}")
-        print()
+        Args:
+            text (str): The raw text the user typed
+            
+        Returns:
+            str or None: The answer (a, b, c, or d), or None if it was invalid
+        """
+        answer = text.strip().lower()
+        if answer in ['a', 'b', 'c', 'd']:
+            return answer
+        self.write(f"❌ {self.message('invalid_answer')}\n")
+        return None
     
     def get_answer(self):
         """
@@ -165,10 +379,9 @@ class Quiz:
             str: The user's answer (a, b, c, or d)
         """
         while True:
-            answer = input("Your answer (a/b/c/d): ").strip().lower()
-            if answer in ['a', 'b', 'c', 'd']:
+            answer = self.parse_answer(input(self.message("answer_prompt")))
+            if answer is not None:
                 return answer
-            print("❌ Invalid input. Please enter a, b, c, or d.")
     
     def check_answer(self, user_answer, question_data):
         """
@@ -176,57 +389,57 @@ class Quiz:
         
         Args:
             user_answer (str): The user's answer
-            question_data (dict): Dictionary containing question details
+            question_data (Question): The question being answered
             
         Returns:
             bool: True if correct, False otherwise
         """
-        correct = question_data['correct']
+        correct = question_data.correct
         is_correct = user_answer == correct
+        if self.analytics is not None:
+            self.analytics.record_answer(question_data, user_answer)
         
         if is_correct:
-            print("\n✅ Correct! Well done!")
+            verdict = f"✅ {self.message('correct')}"
             self.score += 1
         else:
-            print(f"\n❌ Incorrect. The correct answer is: {correct}")
+            verdict = f"❌ {self.message('incorrect', correct=correct)}"
         
-        print(f"💡 Explanation: {question_data['explanation']}")
+        explanation = f"💡 {self.message('explanation', explanation=question_data.explanation)}"
+        self.write(f"\n{verdict}\n{explanation}\n")
         return is_correct
     
     def display_results(self):
         """Display the final quiz results."""
         percentage = (self.score / self.total_questions) * 100
+        if self.analytics is not None:
+            self.analytics.record_result(self.score, self.total_questions)
         
-        print("\n" + "="*70)
-        print("QUIZ COMPLETED!")
-        print("="*70)
-        print(f"\nYour Score: {self.score}/{self.total_questions} ({percentage:.1f}%)")
-        
+        rule = "=" * self.width
+        score = self.message("score", score=self.score, total=self.total_questions, percentage=percentage)
         # Provide feedback based on score
-        if percentage == 100:
-            print("\n🌟 Perfect score! You're a Python decorator master! 🌟")
-        elif percentage >= 80:
-            print("\n🎉 Excellent work! You have a strong understanding!")
-        elif percentage >= 60:
-            print("\n👍 Good job! Review the tutorial for topics you missed.")
-        elif percentage >= 40:
-            print("\n📚 Keep learning! Go through the tutorial again.")
-        else:
-            print("\n💪 Don't give up! Study the tutorial and try again.")
-        
-        print("\n" + "="*70)
+        feedback = self.bank.messages["feedback"][feedback_band(percentage)]
+        self.write("\n".join(["", rule, self.message("completed"), rule, "", score, "", feedback, "", rule]) + "\n")
+    
+    def display_intro(self):
+        """Display the quiz title and introduction."""
+        rule = "=" * self.width
+        self.write("\n".join(["", rule, self.message("title"), rule, "", self.message("intro"),
+                              "", self.message("total_questions", total=len(self.questions)),
+                              "", self.message("begin"), ""]) + "\n")
+    
+    def reset(self):
+        """Clear the score and progress so the session can be taken again."""
+        self.score = 0
+        self.total_questions = 0
+        self.current = 0
     
     def run(self):
-        """Run the quiz."""
-        print("\n" + "="*70)
-        print("PYTHON ADVANCED FEATURES QUIZ")
-        print("="*70)
-        print("\nThis quiz will test your understanding of Python decorators")
-        print("and advanced features covered in the tutorial.")
-        print(f"\nTotal Questions: {len(self.questions)}")
-        print("\nLet's begin!\n")
+        """Run the quiz (from the start, if the session was used before)."""
+        self.reset()
+        self.display_intro()
         
-        input("Press Enter to start... ")
+        input(self.message("press_enter_to_start"))
         
         self.total_questions = len(self.questions)
         
@@ -234,37 +447,52 @@ class Quiz:
             self.display_question(i, question_data)
             user_answer = self.get_answer()
             self.check_answer(user_answer, question_data)
+            self.current = i
             
             if i < self.total_questions:
-                input("\nPress Enter to continue to the next question... ")
+                input("\n" + self.message("press_enter_to_continue"))
         
         self.display_results()
 
 
-def main():
-    """Main function to run the quiz."""
-    quiz = Quiz()
-    
-    try:
-        quiz.run()
-    except KeyboardInterrupt:
-        print("\n\n⚠️  Quiz interrupted. Goodbye!")
-        sys.exit(0)
-    except Exception as e:
-        print(f"\n❌ An error occurred: {e}")
-        sys.exit(1)
-    
-    # Ask if they want to try again
-    print("\nWould you like to take the quiz again?")
-    retry = input("Enter 'yes' to retry or anything else to exit: ").strip().lower()
+def main(locale=DEFAULT_LOCALE, questions=None):
+    """
+    Main function to run the quiz.
+
+    Retries reuse the same Quiz session in a loop (run() resets it), so a
+    kiosk can offer unlimited attempts without the stack or memory growing.
+
+    Args:
+        locale (str): Which question file to use, e.g. 'en' or 'tr'
+        questions (int): Ask this many random questions per attempt, drawn
+            across all topics; None asks every question in order
+    """
+    quiz = Quiz(locale)
     
-    if retry == 'yes':
+    while True:
+        try:
+            if questions is not None:
+                quiz.sample(questions, by_topic=True)
+            quiz.run()
+        except KeyboardInterrupt:
+            print(f"\n\n⚠️  {quiz.message('interrupted')}")
+            sys.exit(0)
+        except Exception as e:
+            print(f"\n❌ {quiz.message('error', error=e)}")
+            sys.exit(1)
+        
+        # Ask if they want to try again
+        print("\n" + quiz.message("retry_question"))
+        retry = input(quiz.message("retry_prompt")).strip().lower()
+        
+        if retry != quiz.message("retry_answer"):
+            break
         print("\n" * 2)
-        main()
-    else:
-        print("\n👋 Thanks for taking the quiz! Keep learning Python! 🐍")
+    
+    print(f"\n👋 {quiz.message('goodbye')}")
 
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_LOCALE,
+         int(sys.argv[2]) if len(sys.argv) > 2 else None)
 
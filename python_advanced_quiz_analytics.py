@@ -0,0 +1,315 @@
+"""
+PYTHON ADVANCED FEATURES QUIZ ANALYTICS
+=======================================
+
+Running statistics over graded quiz answers, for spotting bad questions:
+how often each option is chosen, how often each question is answered
+correctly, and how final scores spread across the feedback bands.
+
+Every update is O(1), and two QuizAnalytics for the same question bank can
+be merged with +, so each worker process can keep its own counts and a
+coordinator adds them up - no answer log ever needs reprocessing.
+
+Attach an instance to live sessions with `quiz.analytics = analytics`, or
+feed it recorded answer sheets:
+
+    python python_advanced_quiz_analytics.py sheets.jsonl
+    python python_advanced_quiz_analytics.py sheets.jsonl --workers 4 --locale tr
+"""
+
+import argparse
+import json
+from itertools import islice
+
+from python_advanced_quiz import DEFAULT_LOCALE, FEEDBACK_BANDS, feedback_band, load_bank
+
+OPTIONS = ("a", "b", "c", "d")
+INVALID = len(OPTIONS)  # Column for answers that aren't one of the options
+_OPTION_COLUMNS = {option: column for column, option in enumerate(OPTIONS)}
+
+
+class QuizAnalytics:
+    """
+    Mergeable running counts for one locale's question bank.
+
+    Attributes:
+        locale (str): The question bank the counts refer to
+        choices (list): Per question, how often a, b, c, d and an invalid
+            answer were given
+        correct (list): Per question, how many answers were correct
+        scores (list): How many finished attempts got each score 0..n
+        bands (dict): How many finished attempts landed in each feedback band
+    """
+
+    def __init__(self, locale=DEFAULT_LOCALE):
+        """
+        Start with empty counts.
+
+        Args:
+            locale (str): Which question bank the answers belong to
+        """
+        self.locale = locale
+        self.questions = load_bank(locale).questions
+        self._index = {question: i for i, question in enumerate(self.questions)}
+        self.choices = [[0] * (len(OPTIONS) + 1) for _ in self.questions]
+        self.correct = [0] * len(self.questions)
+        self.scores = [0] * (len(self.questions) + 1)
+        self.bands = dict.fromkeys([name for _, name in FEEDBACK_BANDS], 0)
+
+    def record_answer(self, question_data, user_answer):
+        """
+        Count one graded answer.
+
+        Args:
+            question_data (Question): The question that was answered
+            user_answer (str): The answer given, normalized like
+                Quiz.parse_answer() (anything else counts as invalid)
+
+        Returns:
+            bool: True if the answer was correct
+        """
+        i = self._index[question_data]
+        self.choices[i][_OPTION_COLUMNS.get(user_answer, INVALID)] += 1
+        is_correct = user_answer == question_data.correct
+        self.correct[i] += is_correct
+        return is_correct
+
+    def record_result(self, score, total_questions):
+        """
+        Count one finished attempt.
+
+        Args:
+            score (int): Number of correct answers
+            total_questions (int): Number of questions in the attempt
+        """
+        self.scores[score] += 1
+        self.bands[feedback_band((score / total_questions) * 100)] += 1
+
+    def record_sheet(self, answers):
+        """
+        Count every answer of a recorded answer sheet, then its result.
+
+        Missing answers count as invalid, extra answers are ignored.
+
+        Args:
+            answers (list): Raw answers, one per question
+        """
+        score = 0
+        for i, question_data in enumerate(self.questions):
+            answer = answers[i] if i < len(answers) else ""
+            answer = answer.strip().lower() if isinstance(answer, str) else ""
+            score += self.record_answer(question_data, answer)
+        self.record_result(score, len(self.questions))
+
+    def __iadd__(self, other):
+        """
+        Add another worker's counts to this one.
+
+        Args:
+            other (QuizAnalytics): Counts for the same question bank
+
+        Returns:
+            QuizAnalytics: self, with other's counts added
+
+        Raises:
+            ValueError: If other counts a different question bank
+        """
+        if other.locale != self.locale or other.questions != self.questions:
+            raise ValueError("Can only merge analytics for the same question bank!")
+        for mine, theirs in zip(self.choices, other.choices):
+            for column, count in enumerate(theirs):
+                mine[column] += count
+        self.correct = [a + b for a, b in zip(self.correct, other.correct)]
+        self.scores = [a + b for a, b in zip(self.scores, other.scores)]
+        for band, count in other.bands.items():
+            self.bands[band] += count
+        return self
+
+    def __add__(self, other):
+        """Return merged counts, leaving both operands unchanged."""
+        merged = QuizAnalytics(self.locale)
+        merged += self
+        merged += other
+        return merged
+
+    def __getstate__(self):
+        """Pickle only the counts - the questions reload from the cached bank."""
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        """Rebuild from the counts made by __getstate__."""
+        self.__dict__.update(QuizAnalytics.from_dict(state).__dict__)
+
+    def to_dict(self):
+        """
+        Export the counts as plain JSON-friendly data.
+
+        Returns:
+            dict: locale, choices, correct, scores and bands
+        """
+        return {"locale": self.locale, "choices": self.choices, "correct": self.correct,
+                "scores": self.scores, "bands": self.bands}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuild counts exported with to_dict().
+
+        Args:
+            data (dict): The exported counts
+
+        Returns:
+            QuizAnalytics: The restored counts
+        """
+        analytics = cls(data["locale"])
+        analytics.choices = [list(row) for row in data["choices"]]
+        analytics.correct = list(data["correct"])
+        analytics.scores = list(data["scores"])
+        analytics.bands = dict(data["bands"])
+        return analytics
+
+    @property
+    def attempts(self):
+        """int: Number of finished attempts recorded."""
+        return sum(self.scores)
+
+    def correct_rate(self, i):
+        """
+        How often question i was answered correctly.
+
+        Args:
+            i (int): Question index (0-based)
+
+        Returns:
+            float: Share of correct answers, or 0.0 if it was never answered
+        """
+        answered = sum(self.choices[i])
+        return self.correct[i] / answered if answered else 0.0
+
+    def flagged_questions(self, min_correct_rate=0.3):
+        """
+        Find questions that look too hard or misleading.
+
+        A question is flagged when it is rarely answered correctly, or when
+        a wrong option (a distractor) is chosen more often than the right one.
+
+        Args:
+            min_correct_rate (float): Correct rates below this are flagged
+
+        Returns:
+            list: (question index, reason) pairs
+        """
+        flagged = []
+        for i, (question_data, counts) in enumerate(zip(self.questions, self.choices)):
+            if not sum(counts):
+                continue
+            right = counts[_OPTION_COLUMNS[question_data.correct]]
+            distractor, chosen = max(((option, counts[column]) for option, column in _OPTION_COLUMNS.items()
+                                      if option != question_data.correct), key=lambda pair: pair[1])
+            if chosen > right:
+                flagged.append((i, f"distractor '{distractor}' chosen more often than '{question_data.correct}'"))
+            elif self.correct_rate(i) < min_correct_rate:
+                flagged.append((i, f"only {self.correct_rate(i):.0%} correct"))
+        return flagged
+
+    def print_report(self):
+        """Print per-question difficulty, option shares and the band distribution."""
+        print(f"\n📈 Quiz analytics ({self.locale}): {self.attempts:,} finished attempts")
+        print(f"\n  {'Q':>3}  {'correct':>7}  " + "  ".join(f"{option:>6}" for option in OPTIONS) + f"  {'invalid':>7}")
+        for i, (question_data, counts) in enumerate(zip(self.questions, self.choices)):
+            answered = sum(counts) or 1
+            shares = "  ".join(f"{counts[column] / answered:5.0%}{'*' if option == question_data.correct else ' '}"
+                               for option, column in _OPTION_COLUMNS.items())
+            print(f"  {i + 1:>3}  {self.correct_rate(i):7.0%}  {shares}  {counts[INVALID] / answered:7.0%}")
+        print("  (* = correct option)")
+
+        attempts = self.attempts or 1
+        print("\n  Feedback bands:")
+        for band, count in self.bands.items():
+            print(f"    {band:<14} {count:>8,}  ({count / attempts:.0%})")
+
+        flagged = self.flagged_questions()
+        if flagged:
+            print("\n  ⚠️  Questions to review:")
+            for i, reason in flagged:
+                print(f"    Q{i + 1}: {reason}")
+
+
+def _analyze_chunk(lines, locale):
+    """
+    Count a chunk of JSONL answer sheets (runs in a worker process).
+
+    Args:
+        lines (list): JSONL lines, one answer sheet each
+        locale (str): Which question bank the sheets answer
+
+    Returns:
+        QuizAnalytics: The chunk's counts
+    """
+    analytics = QuizAnalytics(locale)
+    for line in lines:
+        if line.strip():
+            analytics.record_sheet(json.loads(line).get("answers") or ())
+    return analytics
+
+
+def analyze_file(path, locale=DEFAULT_LOCALE, workers=1, chunk_size=20_000):
+    """
+    Count every answer sheet in a JSONL file, optionally in parallel.
+
+    Each worker counts whole chunks independently and the results are
+    merged. At most two chunks per worker are in flight, so memory stays
+    bounded however large the file is.
+
+    Args:
+        path (str): JSONL file of answer sheets
+        locale (str): Which question bank the sheets answer
+        workers (int): Number of worker processes (1 = no pool)
+        chunk_size (int): Sheets per chunk handed to a worker
+
+    Returns:
+        QuizAnalytics: The merged counts
+    """
+    total = QuizAnalytics(locale)
+    with open(path, encoding="utf-8") as file:
+        chunks = iter(lambda: list(islice(file, chunk_size)), [])
+        if workers <= 1:
+            for chunk in chunks:
+                total += _analyze_chunk(chunk, locale)
+        else:
+            from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+            with ProcessPoolExecutor(workers) as pool:
+                pending = set()
+                for chunk in chunks:
+                    pending.add(pool.submit(_analyze_chunk, chunk, locale))
+                    if len(pending) >= 2 * workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            total += future.result()
+                for future in pending:
+                    total += future.result()
+    return total
+
+
+def main(argv=None):
+    """
+    Command-line entry point: print analytics for JSONL answer sheets.
+
+    Args:
+        argv (list): Command-line arguments; defaults to sys.argv[1:]
+    """
+    parser = argparse.ArgumentParser(description="Per-question statistics for recorded quiz answers.")
+    parser.add_argument("sheets", nargs="+", help="JSONL files of answer sheets")
+    parser.add_argument("--locale", default=DEFAULT_LOCALE)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    total = QuizAnalytics(args.locale)
+    for path in args.sheets:
+        total += analyze_file(path, args.locale, args.workers)
+    total.print_report()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+PYTHON ADVANCED FEATURES QUIZ GRADER
+====================================
+
+Grades recorded answer sheets offline, without printing anything per
+answer. Each sheet is one JSON object per line (JSONL):
+
+    {"user": "alice", "answers": ["b", "c", "b", "c", "b", "b", "b", "a", "b", "c"]}
+
+Sheets are read in chunks and each chunk is graded with one vectorized
+NumPy comparison against the question bank, so hundreds of thousands of
+sheets grade in seconds. The results match the interactive quiz exactly:
+an answer is normalized like Quiz.parse_answer() (stripped, lowercased)
+and compared like Quiz.check_answer(), and the score line and feedback
+message are the ones Quiz.display_results() prints. A missing or invalid
+answer counts as incorrect (the interactive quiz would ask again).
+
+Usage:
+    python python_advanced_quiz_grader.py sheets.jsonl                  # results to stdout
+    python python_advanced_quiz_grader.py sheets.jsonl -o results.jsonl --locale tr
+"""
+
+import argparse
+import json
+import sys
+from collections import namedtuple
+from itertools import islice
+
+import numpy as np
+
+from python_advanced_quiz import DEFAULT_LOCALE, FEEDBACK_BANDS, load_bank
+
+# Grades for a batch of sheets. correct is an (n_sheets, n_questions) bool
+# matrix; scores, percentages and bands have one entry per sheet.
+GradeReport = namedtuple("GradeReport", "users correct scores percentages bands")
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+def read_sheets(lines):
+    """
+    Parse answer sheets from JSONL lines, skipping blank lines.
+
+    Args:
+        lines: An iterable of JSON strings, e.g. an open file
+
+    Yields:
+        dict: One answer sheet per non-empty line
+    """
+    for line in lines:
+        if line.strip():
+            yield json.loads(line)
+
+
+def grade_sheets(sheets, locale=DEFAULT_LOCALE, offset=0):
+    """
+    Grade a batch of answer sheets against a locale's question bank.
+
+    Args:
+        sheets (list): Dicts with an "answers" list and an optional "user"
+        locale (str): Which question bank to grade against
+        offset (int): Position of the first sheet in the whole stream;
+            sheets without a "user" are identified by their position
+
+    Returns:
+        GradeReport: Correctness matrix, scores, percentages and feedback
+        bands for every sheet, in input order
+    """
+    bank = load_bank(locale)
+    total = len(bank.questions)
+    users = [sheet.get("user", i) for i, sheet in enumerate(sheets, offset)]
+
+    rows = [sheet.get("answers") or () for sheet in sheets]
+    if any(len(row) != total for row in rows):
+        # Pad short sheets with "" (never correct) and drop extra answers
+        rows = [list(row[:total]) + [""] * (total - len(row)) for row in rows]
+    answers = np.array(rows, dtype=str).reshape(len(rows), total)
+
+    letters = np.array([question.correct for question in bank.questions])
+    if answers.dtype.itemsize <= np.dtype("U1").itemsize:
+        # Every answer is at most one character, so strip() can't turn a
+        # wrong answer into a right one and lower() only matters for A-D
+        correct = (answers == letters) | (answers == np.char.upper(letters))
+    else:
+        correct = np.char.lower(np.char.strip(answers)) == letters
+    scores = correct.sum(axis=1)
+    percentages = (scores / total) * 100
+    # Same first-match rule as feedback_band(), for every sheet at once
+    bands = np.select([percentages >= threshold for threshold, _ in FEEDBACK_BANDS],
+                      [name for _, name in FEEDBACK_BANDS], default=FEEDBACK_BANDS[-1][1])
+    return GradeReport(users, correct, scores, percentages, bands)
+
+
+def grade_stream(sheets, locale=DEFAULT_LOCALE, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Grade an unbounded stream of answer sheets chunk by chunk.
+
+    Only one chunk is held in memory at a time.
+
+    Args:
+        sheets: An iterable of answer sheet dicts
+        locale (str): Which question bank to grade against
+        chunk_size (int): Sheets graded per vectorized batch
+
+    Yields:
+        GradeReport: The grades for each chunk, in input order
+    """
+    sheets = iter(sheets)
+    offset = 0
+    while True:
+        chunk = list(islice(sheets, chunk_size))
+        if not chunk:
+            return
+        yield grade_sheets(chunk, locale, offset)
+        offset += len(chunk)
+
+
+def result_records(report, locale=DEFAULT_LOCALE):
+    """
+    Turn a GradeReport into one result dict per sheet.
+
+    "score_line" and "feedback" are the exact texts Quiz.display_results()
+    prints for the same answers.
+
+    Args:
+        report (GradeReport): Grades from grade_sheets() or grade_stream()
+        locale (str): The locale the report was graded in
+
+    Yields:
+        dict: user, score, total, percentage, band, score_line, feedback
+        and the per-question correctness list
+    """
+    messages = load_bank(locale).messages
+    total = report.correct.shape[1]
+    for user, row, score, percentage, band in zip(report.users, report.correct.tolist(),
+                                                   report.scores.tolist(), report.percentages.tolist(),
+                                                   report.bands.tolist()):
+        yield {
+            "user": user,
+            "score": score,
+            "total": total,
+            "percentage": percentage,
+            "band": band,
+            "score_line": messages["score"].format(score=score, total=total, percentage=percentage),
+            "feedback": messages["feedback"][band],
+            "correct": row,
+        }
+
+
+def main(argv=None):
+    """
+    Command-line entry point: grade a JSONL file of answer sheets.
+
+    Writes one JSON result per sheet, then prints a summary to stderr.
+
+    Args:
+        argv (list): Command-line arguments; defaults to sys.argv[1:]
+    """
+    parser = argparse.ArgumentParser(description="Grade recorded quiz answer sheets.")
+    parser.add_argument("sheets", help="JSONL file of answer sheets ('-' for stdin)")
+    parser.add_argument("-o", "--output", help="where to write JSONL results (default: stdout)")
+    parser.add_argument("--locale", default=DEFAULT_LOCALE)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.sheets == "-" else open(args.sheets, encoding="utf-8")
+    target = sys.stdout if args.output is None else open(args.output, "w", encoding="utf-8")
+    graded, score_sum, per_question = 0, 0, None
+    band_counts = dict.fromkeys([name for _, name in FEEDBACK_BANDS], 0)
+    with source, target:
+        for report in grade_stream(read_sheets(source), args.locale, args.chunk_size):
+            target.writelines(json.dumps(record, ensure_ascii=False) + "\n"
+                              for record in result_records(report, args.locale))
+            graded += len(report.users)
+            score_sum += int(report.scores.sum())
+            column_totals = report.correct.sum(axis=0)
+            per_question = column_totals if per_question is None else per_question + column_totals
+            for band, count in zip(*np.unique(report.bands, return_counts=True)):
+                band_counts[str(band)] += int(count)
+
+    print(f"📊 Graded {graded:,} answer sheets", file=sys.stderr)
+    if graded:
+        print(f"   Average score: {score_sum / graded:.2f}", file=sys.stderr)
+        rates = ", ".join(f"Q{i}: {count / graded:.0%}" for i, count in enumerate(per_question.tolist(), 1))
+        print(f"   Correct per question: {rates}", file=sys.stderr)
+        print(f"   Feedback bands: {band_counts}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
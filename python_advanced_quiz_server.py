@@ -0,0 +1,290 @@
+"""
+PYTHON ADVANCED FEATURES QUIZ SERVER
+====================================
+
+Serves the quiz over TCP (or a Unix socket) with asyncio. Quiz.run() blocks
+on input() for every answer, so one process can only serve one learner.
+Here every learner is a coroutine instead: while one session waits for an
+answer, the event loop serves all the others, so a single process can run
+thousands of sessions at once.
+
+The sessions reuse Quiz.display_question(), check_answer() and
+display_results(), so learners see exactly the same text as in the
+interactive quiz. The "Press Enter" pauses are skipped - over a socket the
+next question is sent right after the explanation.
+
+Usage:
+    python python_advanced_quiz_server.py serve                 # TCP on port 8765
+    python python_advanced_quiz_server.py serve --locale tr --unix /tmp/quiz.sock
+    python python_advanced_quiz_server.py load-test --clients 2000
+
+Then connect with e.g. `nc localhost 8765` and answer each question.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import io
+import os
+import random
+import statistics
+import time
+
+from python_advanced_quiz import DEFAULT_LOCALE, Quiz
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+IDLE_TIMEOUT = 300  # Seconds a learner may take to answer before being disconnected
+
+
+async def run_session(reader, writer, locale=DEFAULT_LOCALE, idle_timeout=IDLE_TIMEOUT, analytics=None):
+    """
+    Run one quiz session over an asyncio stream pair.
+
+    Everything the Quiz prints goes into a per-session buffer, which is sent
+    to the client together with the answer prompt whenever the session
+    needs input.
+
+    Args:
+        reader (asyncio.StreamReader): Where the learner's answers come from
+        writer (asyncio.StreamWriter): Where the quiz text goes
+        locale (str): Which question file to use, e.g. 'en' or 'tr'
+        idle_timeout (float): Seconds to wait for each answer
+        analytics (QuizAnalytics): Optional shared counts to record answers in
+
+    Returns:
+        int or None: The final score, or None if the learner disconnected
+        or timed out before finishing, or sent a line too long to read
+    """
+    quiz = Quiz(locale)
+    quiz.output = io.StringIO()
+    quiz.analytics = analytics
+
+    async def send(prompt=""):
+        text = quiz.output.getvalue() + prompt
+        quiz.output.seek(0)
+        quiz.output.truncate()
+        writer.write(text.encode("utf-8"))
+        await writer.drain()
+
+    try:
+        quiz.display_intro()
+        quiz.total_questions = len(quiz.questions)
+
+        for i, question_data in enumerate(quiz.questions, 1):
+            quiz.display_question(i, question_data)
+            user_answer = None
+            while user_answer is None:
+                await send(quiz.message("answer_prompt"))
+                try:
+                    line = await asyncio.wait_for(reader.readline(), idle_timeout)
+                except ValueError:
+                    return None  # An over-long line (past the stream's limit)
+                if not line:
+                    return None  # The learner disconnected
+                user_answer = quiz.parse_answer(line.decode("utf-8", "replace"))
+            quiz.check_answer(user_answer, question_data)
+            quiz.current = i
+
+        quiz.display_results()
+        await send()
+        return quiz.score
+    except (asyncio.TimeoutError, ConnectionError):
+        return None
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
+
+
+async def start_server(host=DEFAULT_HOST, port=DEFAULT_PORT, path=None, locale=DEFAULT_LOCALE, analytics=None):
+    """
+    Start accepting quiz sessions.
+
+    Args:
+        host (str): Interface to listen on (TCP)
+        port (int): Port to listen on; 0 picks a free one (TCP)
+        path (str): Listen on this Unix socket instead of TCP
+        locale (str): Which question file every session uses
+        analytics (QuizAnalytics): Optional counts shared by every session
+
+    Returns:
+        asyncio.Server: The running server
+    """
+    handler = functools.partial(run_session, locale=locale, analytics=analytics)
+    if path is not None:
+        return await asyncio.start_unix_server(handler, path=path, backlog=4096)
+    return await asyncio.start_server(handler, host, port, backlog=4096)
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, path=None, locale=DEFAULT_LOCALE):
+    """
+    Run the quiz server until it is interrupted.
+
+    Args:
+        host (str): Interface to listen on (TCP)
+        port (int): Port to listen on (TCP)
+        path (str): Listen on this Unix socket instead of TCP
+        locale (str): Which question file every session uses
+    """
+    server = await start_server(host, port, path, locale)
+    where = path or f"{host}:{port}"
+    print(f"📡 Serving the '{locale}' quiz on {where} (Ctrl+C to stop)")
+    async with server:
+        await server.serve_forever()
+
+
+# ============================================================================
+# LOAD TEST
+# ============================================================================
+
+async def _simulated_learner(connect, prompt, answers, latencies, think_time, rng):
+    """
+    Take the quiz as one learner, timing every answer.
+
+    An answer's latency is the time from sending it to receiving the next
+    answer prompt (or, for the last answer, the complete results).
+
+    Args:
+        connect: Coroutine function returning a (reader, writer) pair
+        prompt (bytes): The answer prompt that marks the end of each question
+        answers (list): The answers to send, one per question
+        latencies (list): Where to append the measured latencies (seconds)
+        think_time (float): Maximum random pause before each answer
+        rng (random.Random): Source of the think-time pauses
+    """
+    reader, writer = await connect()
+    try:
+        await reader.readuntil(prompt)
+        for i, answer in enumerate(answers, 1):
+            if think_time:
+                await asyncio.sleep(rng.uniform(0, think_time))
+            start = time.perf_counter()
+            writer.write(answer.encode() + b"\n")
+            await writer.drain()
+            if i < len(answers):
+                await reader.readuntil(prompt)
+            else:
+                await reader.read()  # The results, then the server closes
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
+
+
+async def load_test(clients=1000, locale=DEFAULT_LOCALE, think_time=0.0, path=None, seed=0):
+    """
+    Simulate many learners taking the quiz at once against a local server.
+
+    The server and the simulated learners share one event loop, so the
+    numbers include the clients' own overhead - they are an upper bound
+    on the server's latency.
+
+    Args:
+        clients (int): Number of concurrent learners
+        locale (str): Which question file to use
+        think_time (float): Maximum random pause (seconds) before each answer
+        path (str): Use this Unix socket instead of a TCP port
+        seed (int): Seed for the learners' answers and pauses
+
+    Returns:
+        dict: sessions, answers, elapsed seconds, and p50/p99/max answer
+        latency in milliseconds (None if no answer was timed)
+    """
+    server = await start_server(port=0, path=path, locale=locale)
+    if path is not None:
+        connect = functools.partial(asyncio.open_unix_connection, path)
+    else:
+        host, port = server.sockets[0].getsockname()[:2]
+        connect = functools.partial(asyncio.open_connection, host, port)
+
+    quiz = Quiz(locale)
+    prompt = quiz.message("answer_prompt").encode("utf-8")
+    rng = random.Random(seed)
+    latencies = []
+    learners = [
+        _simulated_learner(connect, prompt, [rng.choice("abcd") for _ in quiz.questions],
+                           latencies, think_time, random.Random(rng.random()))
+        for _ in range(clients)
+    ]
+
+    start = time.perf_counter()
+    try:
+        async with server:
+            results = await asyncio.gather(*learners, return_exceptions=True)
+    finally:
+        if path is not None:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+    elapsed = time.perf_counter() - start
+
+    failures = [result for result in results if isinstance(result, BaseException)]
+    report = {
+        "sessions": clients - len(failures),
+        "failed": len(failures),
+        "answers": len(latencies),
+        "elapsed": elapsed,
+        "p50_ms": None,
+        "p99_ms": None,
+        "max_ms": None,
+    }
+    if latencies:
+        cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+        report.update(p50_ms=cuts[49] * 1000, p99_ms=cuts[98] * 1000, max_ms=max(latencies) * 1000)
+    return report
+
+
+def print_report(report):
+    """
+    Print the results of load_test().
+
+    Args:
+        report (dict): The dictionary returned by load_test()
+    """
+    print(f"  Sessions completed: {report['sessions']:,} ({report['failed']} failed)")
+    print(f"  Answers graded:     {report['answers']:,} in {report['elapsed']:.2f}s "
+          f"({report['answers'] / report['elapsed']:,.0f}/s)")
+    if report["p50_ms"] is None:
+        print("  Answer latency:     no answers were timed")
+        return
+    print(f"  Answer latency:     p50 {report['p50_ms']:.2f} ms, p99 {report['p99_ms']:.2f} ms, "
+          f"max {report['max_ms']:.2f} ms")
+
+
+def main(argv=None):
+    """
+    Command-line entry point: serve the quiz or load-test it.
+
+    Args:
+        argv (list): Command-line arguments; defaults to sys.argv[1:]
+    """
+    parser = argparse.ArgumentParser(description="Serve the Python quiz to many learners at once.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="run the quiz server")
+    serve_parser.add_argument("--host", default=DEFAULT_HOST)
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve_parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    serve_parser.add_argument("--locale", default=DEFAULT_LOCALE)
+
+    load_parser = commands.add_parser("load-test", help="simulate many concurrent learners")
+    load_parser.add_argument("--clients", type=int, default=1000)
+    load_parser.add_argument("--think-time", type=float, default=0.0,
+                             help="maximum random pause in seconds before each answer")
+    load_parser.add_argument("--unix", metavar="PATH", help="use a Unix socket instead of TCP")
+    load_parser.add_argument("--locale", default=DEFAULT_LOCALE)
+
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(serve(args.host, args.port, args.unix, args.locale))
+        print("\n👋 Server stopped.")
+    else:
+        print(f"🧪 Load test: {args.clients:,} concurrent learners")
+        print_report(asyncio.run(load_test(args.clients, args.locale, args.think_time, args.unix)))
+
+
+if __name__ == "__main__":
+    main()
@@ -14,16 +14,18 @@ Topics Covered:
 6. Function Overloading (@overload)
 7. Final Classes and Methods (@final)
 8. Override Decorator (@override)
+
+Usage:
+    python python_advanced_tutorial.py     # run every example
+
+Importing the module has no side effects; call run_examples() to run the
+examples from another program.
 """
 
 # ============================================================================
 # SECTION 1: BASIC DECORATORS
 # ============================================================================
 
-print("=" * 60)
-print("SECTION 1: BASIC DECORATORS")
-print("=" * 60)
-
 """
 What is a Decorator?
 --------------------
@@ -32,17 +34,30 @@ without explicitly modifying it. Think of it like gift wrapping - the gift
 stays the same, but you add something extra around it.
 """
 
+import inspect
+
 
 def my_decorator(func):
     """
     A simple decorator that adds behavior before and after a function call.
     
+    If func is a coroutine function (async def), the wrapper must be one
+    too, so it can await func() - otherwise the coroutine would be
+    returned without ever running.
+    
     Args:
         func: The function to be decorated
         
     Returns:
         wrapper: A new function that wraps the original function
     """
+    if inspect.iscoroutinefunction(func):
+        async def async_wrapper():
+            print("🎁 Something is happening before the function is called.")
+            await func()
+            print("🎁 Something is happening after the function is called.")
+        return async_wrapper
+
     def wrapper():
         print("🎁 Something is happening before the function is called.")
         func()
@@ -56,11 +71,6 @@ def say_hello():
     print("👋 Hello!")
 
 
-# Using the decorator
-print("\nExample 1: Basic Decorator")
-say_hello()
-
-
 def repeat_three_times(func):
     """
     A decorator that repeats a function call three times.
@@ -71,6 +81,13 @@ def repeat_three_times(func):
     Returns:
         wrapper: A function that calls the original three times
     """
+    if inspect.iscoroutinefunction(func):
+        async def async_wrapper(*args, **kwargs):
+            for i in range(3):
+                print(f"  Call #{i+1}:")
+                await func(*args, **kwargs)
+        return async_wrapper
+
     def wrapper(*args, **kwargs):
         for i in range(3):
             print(f"  Call #{i+1}:")
@@ -84,18 +101,23 @@ def greet(name):
     print(f"  Hello, {name}!")
 
 
-print("\nExample 2: Decorator with Arguments")
-greet("Alice")
+def _section_1_examples():
+    """Run the basic decorator examples."""
+    print("=" * 60)
+    print("SECTION 1: BASIC DECORATORS")
+    print("=" * 60)
+
+    print("\nExample 1: Basic Decorator")
+    say_hello()
+
+    print("\nExample 2: Decorator with Arguments")
+    greet("Alice")
 
 
 # ============================================================================
 # SECTION 2: PROPERTY DECORATORS (@property, @setter, @deleter)
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("SECTION 2: PROPERTY DECORATORS")
-print("=" * 60)
-
 """
 What are Property Decorators?
 ------------------------------
@@ -215,36 +237,432 @@ class Person:
         return self.__age >= 18
 
 
-# Using property decorators
-print("\nExample 3: Using @property")
-person = Person("Bob", 25)
-print(f"Name: {person.name}")  # Calls the getter
-print(f"Age: {person.age}")
-print(f"Is adult? {person.is_adult}")
+class SlottedPerson:
+    """
+    A memory-light variant of Person for storing millions of records.
+
+    __slots__ replaces the per-instance __dict__ with fixed attribute
+    slots, the getters are silent, and the setters check the common valid
+    case first. Validation rules and ValueError messages are exactly the
+    same as Person's.
+    """
 
-print("\nExample 4: Using @setter")
-person.name = "Robert"  # Calls the setter
-person.age = 26
+    __slots__ = ("__name", "__age")
+
+    def __init__(self, name, age):
+        """
+        Initialize a SlottedPerson object.
+
+        Args:
+            name (str): The person's name
+            age (int): The person's age
+        """
+        self.__name = name
+        self.__age = age
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Create many people at once from (name, age) pairs.
+
+        The whole batch is validated before any object is created: first
+        all names, then all ages, in the same order as the setters.
+
+        Args:
+            records: An iterable of (name, age) pairs
+
+        Returns:
+            list: A list of SlottedPerson objects
+
+        Raises:
+            ValueError: With the setter's message if any record is invalid
+        """
+        records = records if isinstance(records, (list, tuple)) else list(records)
+        names = [name for name, _ in records]
+        ages = [age for _, age in records]
+
+        if any(not isinstance(name, str) for name in names):
+            raise ValueError("Name must be a string!")
+        if not all(map(str.strip, names)):
+            raise ValueError("Name cannot be empty!")
+        if any(not isinstance(age, int) for age in ages):
+            raise ValueError("Age must be an integer!")
+        if ages and min(ages) < 0:
+            raise ValueError("Age cannot be negative!")
+        if ages and max(ages) > 150:
+            raise ValueError("Age seems unrealistic!")
+
+        new = object.__new__
+        people = []
+        append = people.append
+        for name, age in zip(names, ages):
+            person = new(cls)
+            person.__name = name
+            person.__age = age
+            append(person)
+        return people
+
+    @property
+    def name(self):
+        """
+        Getter for name property (silent, unlike Person.name).
+
+        Returns:
+            str: The person's name
+        """
+        return self.__name
+
+    @name.setter
+    def name(self, value):
+        """
+        Setter for name property with validation.
+
+        Args:
+            value (str): The new name value
+
+        Raises:
+            ValueError: If name is empty or not a string
+        """
+        # Fast path: a non-blank str needs no strip() copy
+        if type(value) is str and value and not value.isspace():
+            self.__name = value
+            return
+        if not isinstance(value, str):
+            raise ValueError("Name must be a string!")
+        if len(value.strip()) == 0:
+            raise ValueError("Name cannot be empty!")
+        self.__name = value
+
+    @name.deleter
+    def name(self):
+        """Deleter for name property."""
+        self.__name = None
+
+    @property
+    def age(self):
+        """
+        Getter for age property.
+
+        Returns:
+            int: The person's age
+        """
+        return self.__age
+
+    @age.setter
+    def age(self, value):
+        """
+        Setter for age property with validation.
+
+        Args:
+            value (int): The new age value
+
+        Raises:
+            ValueError: If age is negative or not an integer
+        """
+        # Fast path: a plain int in range needs only one type check
+        if type(value) is int and 0 <= value <= 150:
+            self.__age = value
+            return
+        if not isinstance(value, int):
+            raise ValueError("Age must be an integer!")
+        if value < 0:
+            raise ValueError("Age cannot be negative!")
+        if value > 150:
+            raise ValueError("Age seems unrealistic!")
+        self.__age = value
+
+    @property
+    def is_adult(self):
+        """
+        A computed property (read-only).
+
+        Returns:
+            bool: True if person is 18 or older
+        """
+        return self.__age >= 18
+
+
+import importlib
+
+# Heavy or optional dependencies are imported on first use instead of at
+# import time, so importing the tutorial stays fast. Module code calls
+# _lazy_import(name); other modules just use tutorial.<name> and the
+# module-level __getattr__ below loads it. Values are "module" or
+# "module:attribute".
+_LAZY_IMPORTS = {
+    # NumPy is optional - only the columnar classes (PersonTable, ShapeArray) need it
+    "np": "numpy",
+}
+
+
+def _lazy_import(name):
+    """
+    Import a lazily loaded dependency and cache it as a module global.
+
+    Args:
+        name (str): A key of _LAZY_IMPORTS, e.g. "np"
+
+    Returns:
+        The imported module or attribute, or None if it isn't installed
+    """
+    try:
+        return globals()[name]
+    except KeyError:
+        pass
+    module_name, _, attribute = _LAZY_IMPORTS[name].partition(":")
+    try:
+        value = importlib.import_module(module_name)
+    except ImportError:
+        value = None
+    if value is not None and attribute:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name):
+    """
+    Load lazy dependencies on first attribute access (PEP 562).
+
+    Python only calls this for names that aren't module globals yet, so
+    once a dependency is loaded, tutorial.<name> is a plain lookup.
+    """
+    if name in _LAZY_IMPORTS:
+        return _lazy_import(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class PersonValidationError(ValueError):
+    """
+    Raised when one or more rows of a PersonTable are invalid.
+
+    Attributes:
+        errors (list): (row index, message) pairs, sorted by row index.
+            Each message is exactly what Person's age setter would raise.
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        shown = "; ".join(f"row {index}: {message}" for index, message in errors[:10])
+        if len(errors) > 10:
+            shown += f"; ... and {len(errors) - 10} more"
+        super().__init__(f"{len(errors)} invalid row(s): {shown}")
+
+
+class PersonTable:
+    """
+    A columnar table of people: one list of names and one array of ages.
+
+    Instead of validating each Person through its age setter, the table
+    runs the same checks (integer, not negative, not above 150) on the
+    whole age column at once and reports every bad row together.
+    is_adult is a boolean mask over all rows, so no Person objects are
+    created. Requires NumPy (pip install numpy).
+    """
+
+    def __init__(self, names, ages):
+        """
+        Initialize a table from a names column and an ages column.
+
+        Args:
+            names: Sequence of names
+            ages: Sequence or integer array of ages
+
+        Raises:
+            ValueError: If the columns have different lengths
+            PersonValidationError: If any age is invalid
+        """
+        if _lazy_import("np") is None:
+            raise ImportError("PersonTable requires NumPy: pip install numpy")
+        self.names = list(names)
+        self.ages = self._validate_ages(ages)
+        if len(self.names) != len(self.ages):
+            raise ValueError("names and ages must have the same length!")
+
+    @staticmethod
+    def _validate_ages(ages) -> "np.ndarray":
+        """
+        Apply the age setter's checks to a whole column.
+
+        Args:
+            ages: Sequence or array of ages
+
+        Returns:
+            np.ndarray: The ages as a compact uint8 array
+
+        Raises:
+            PersonValidationError: Listing every invalid row
+        """
+        np = _lazy_import("np")
+        if isinstance(ages, np.ndarray) and ages.dtype.kind in "biu":
+            values = ages.reshape(-1)
+            is_int = np.ones(len(values), dtype=bool)
+        else:
+            ages = ages if isinstance(ages, (list, tuple)) else list(ages)
+            is_int = np.fromiter(map(isinstance, ages, [int] * len(ages)), dtype=bool, count=len(ages))
+            if is_int.all():
+                try:
+                    values = np.array(ages, dtype=np.int64)
+                except OverflowError:
+                    # Python ints beyond 64 bits - compare them as objects
+                    values = np.array(ages, dtype=object)
+            else:
+                values = np.zeros(len(ages), dtype=object)
+                values[is_int] = [age for age, ok in zip(ages, is_int) if ok]
+
+        negative = is_int & (values < 0)
+        unrealistic = is_int & (values > 150)
+        bad = ~is_int | negative | unrealistic
+        if bad.any():
+            messages = np.where(~is_int, "Age must be an integer!",
+                                np.where(negative, "Age cannot be negative!", "Age seems unrealistic!"))
+            rows = np.flatnonzero(bad)
+            raise PersonValidationError(list(zip(rows.tolist(), messages[rows].tolist())))
+        return values.astype(np.uint8)
+
+    @classmethod
+    def from_csv(cls, file, name_column="name", age_column="age"):
+        """
+        Load a table from CSV with a header row.
+
+        Ages that are not integer literals (e.g. "abc" or "25.5") are kept
+        as text so they are reported as "Age must be an integer!".
+
+        Args:
+            file: A path or an open text file
+            name_column (str): Header of the name column
+            age_column (str): Header of the age column
+
+        Returns:
+            PersonTable: The loaded table
+
+        Raises:
+            PersonValidationError: If any age is invalid
+        """
+        import csv
+
+        if isinstance(file, str):
+            with open(file, newline="", encoding="utf-8") as handle:
+                return cls.from_csv(handle, name_column, age_column)
+
+        names, ages = [], []
+        for row in csv.DictReader(file):
+            names.append(row[name_column])
+            ages.append(row[age_column])
+        return cls(names, [_parse_int(age) for age in ages])
+
+    @classmethod
+    def from_persons(cls, people):
+        """
+        Build a table from Person-like objects (anything with name/age).
+
+        Args:
+            people: An iterable of Person or SlottedPerson objects
+
+        Returns:
+            PersonTable: The columnar version of the people
+        """
+        people = list(people)
+        return cls([p.name for p in people], [p.age for p in people])
+
+    def to_persons(self, person_class=SlottedPerson) -> list:
+        """
+        Materialize the rows as person objects.
+
+        Args:
+            person_class: Person or SlottedPerson
+
+        Returns:
+            list: One person object per row
+        """
+        return [person_class(name, age) for name, age in zip(self.names, self.ages.tolist())]
+
+    def __len__(self) -> int:
+        """Number of rows in the table."""
+        return len(self.names)
+
+    @property
+    def is_adult(self) -> "np.ndarray":
+        """
+        A computed column (read-only), like Person.is_adult.
+
+        Returns:
+            np.ndarray: Boolean mask, True where age is 18 or older
+        """
+        return self.ages >= 18
+
+    def __repr__(self) -> str:
+        """String representation of the table."""
+        return f"PersonTable(rows={len(self)})"
 
-print("\nExample 5: Property validation")
-try:
-    person.age = -5  # This will raise an error
-except ValueError as e:
-    print(f"  ❌ Error: {e}")
 
-print("\nExample 6: Using @deleter")
-del person.name  # Calls the deleter
-print(f"Name after deletion: {person.name}")
+def _parse_int(text):
+    """
+    Parse an integer literal, returning the text unchanged if it isn't one.
+
+    Args:
+        text (str): The raw CSV cell
+
+    Returns:
+        int or str: The parsed integer, or the original text
+    """
+    try:
+        return int(text)
+    except ValueError:
+        return text
+
+
+def _section_2_examples():
+    """Run the property decorator examples."""
+    print("\n" + "=" * 60)
+    print("SECTION 2: PROPERTY DECORATORS")
+    print("=" * 60)
+
+    print("\nExample 3: Using @property")
+    person = Person("Bob", 25)
+    print(f"Name: {person.name}")  # Calls the getter
+    print(f"Age: {person.age}")
+    print(f"Is adult? {person.is_adult}")
+
+    print("\nExample 4: Using @setter")
+    person.name = "Robert"  # Calls the setter
+    person.age = 26
+
+    print("\nExample 5: Property validation")
+    try:
+        person.age = -5  # This will raise an error
+    except ValueError as e:
+        print(f"  ❌ Error: {e}")
+
+    print("\nExample 6: Using @deleter")
+    del person.name  # Calls the deleter
+    print(f"Name after deletion: {person.name}")
+
+    print("\nExample 6b: Slotted Person for large batches")
+    people = SlottedPerson.from_records([("Alice", 30), ("Bob", 12)])
+    print(f"  {[(p.name, p.age, p.is_adult) for p in people]}")
+    print(f"  Has __dict__? {hasattr(people[0], '__dict__')}")
+    try:
+        SlottedPerson.from_records([("Carol", 40), ("Dave", 200)])
+    except ValueError as e:
+        print(f"  ❌ Error: {e}")
+
+    print("\nExample 6c: Columnar PersonTable")
+    if _lazy_import("np") is None:
+        print("  ⚠️  NumPy is not installed - skipping PersonTable example")
+    else:
+        table = PersonTable(["Alice", "Bob", "Carol"], [30, 12, 45])
+        print(f"  {table}: is_adult mask = {table.is_adult}")
+        try:
+            PersonTable(["Dave", "Eve", "Frank"], [-5, "old", 200])
+        except PersonValidationError as e:
+            print(f"  ❌ Error: {e}")
 
 
 # ============================================================================
 # SECTION 3: STATIC METHODS (@staticmethod)
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("SECTION 3: STATIC METHODS")
-print("=" * 60)
-
 """
 What is @staticmethod?
 ----------------------
@@ -306,26 +724,27 @@ class MathOperations:
         return number % 2 == 0
 
 
-# Using static methods
-print("\nExample 7: Static Methods")
-print(f"5 + 3 = {MathOperations.add(5, 3)}")
-print(f"5 * 3 = {MathOperations.multiply(5, 3)}")
-print(f"Is 4 even? {MathOperations.is_even(4)}")
-print(f"Is 7 even? {MathOperations.is_even(7)}")
+def _section_3_examples():
+    """Run the static method examples."""
+    print("\n" + "=" * 60)
+    print("SECTION 3: STATIC METHODS")
+    print("=" * 60)
+
+    print("\nExample 7: Static Methods")
+    print(f"5 + 3 = {MathOperations.add(5, 3)}")
+    print(f"5 * 3 = {MathOperations.multiply(5, 3)}")
+    print(f"Is 4 even? {MathOperations.is_even(4)}")
+    print(f"Is 7 even? {MathOperations.is_even(7)}")
 
-# You can also call static methods on instances (but it's not common)
-math_ops = MathOperations()
-print(f"Instance call: 10 + 5 = {math_ops.add(10, 5)}")
+    # You can also call static methods on instances (but it's not common)
+    math_ops = MathOperations()
+    print(f"Instance call: 10 + 5 = {math_ops.add(10, 5)}")
 
 
 # ============================================================================
 # SECTION 4: CLASS METHODS (@classmethod)
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("SECTION 4: CLASS METHODS")
-print("=" * 60)
-
 """
 What is @classmethod?
 ---------------------
@@ -337,88 +756,523 @@ Use @classmethod for:
 - Methods that need to access or modify class variables
 """
 
+import contextlib
+import os
+import threading
+from collections import namedtuple
+from functools import lru_cache
 
-class Pizza:
-    """A class demonstrating class methods for alternative constructors."""
-    
-    # Class variable (shared by all instances)
-    total_pizzas_made = 0
-    
-    def __init__(self, ingredients):
+_LAZY_IMPORTS.update(json="json")
+
+
+class ShardedCounter:
+    """
+    An exact counter that many threads can bump without losing updates.
+
+    `counter += 1` on a shared int is a read-modify-write: two threads can
+    read the same value and one increment is lost. A lock fixes that but
+    makes every thread queue on it. Instead, each thread adds to its own
+    shard, which no other thread writes, and reading the value sums the
+    shards. Shards are keyed by thread id, so a finished thread's count is
+    kept and a new thread that reuses its id simply carries on from it.
+    """
+
+    __slots__ = ("_shards", "_lock")
+
+    def __init__(self):
+        """Start counting at zero."""
+        self._shards = {}  # thread id -> [count]
+        self._lock = threading.Lock()  # Only taken to add a shard or to read
+
+    def add(self, n=1):
         """
-        Initialize a Pizza with given ingredients.
-        
+        Add n to the calling thread's shard.
+
         Args:
-            ingredients (list): List of ingredient strings
+            n (int): How much to add
         """
-        self.ingredients = ingredients
-        Pizza.total_pizzas_made += 1
-    
+        shard = self._shards.get(threading.get_ident())
+        if shard is None:
+            with self._lock:
+                shard = self._shards.setdefault(threading.get_ident(), [0])
+        shard[0] += n
+
+    @property
+    def value(self):
+        """int: The total over all shards."""
+        with self._lock:
+            shards = list(self._shards.values())
+        return sum(shard[0] for shard in shards)
+
+    def __int__(self):
+        return self.value
+
     def __repr__(self):
-        """String representation of the pizza."""
-        return f"Pizza({', '.join(self.ingredients)})"
-    
-    @classmethod
-    def margherita(cls):
-        """
-        Factory method to create a Margherita pizza.
-        
-        This is a class method that acts as an alternative constructor.
-        Instead of Pizza(['tomato', 'mozzarella', 'basil']), you can
-        simply call Pizza.margherita().
-        
-        Returns:
-            Pizza: A Margherita pizza instance
-        """
-        return cls(['tomato sauce', 'mozzarella', 'basil'])
-    
-    @classmethod
-    def pepperoni(cls):
-        """
-        Factory method to create a Pepperoni pizza.
-        
-        Returns:
-            Pizza: A Pepperoni pizza instance
-        """
-        return cls(['tomato sauce', 'mozzarella', 'pepperoni'])
-    
-    @classmethod
-    def get_total_pizzas(cls):
+        return f"ShardedCounter({self.value})"
+
+
+class CounterAttribute:
+    """A read-only class attribute that reads as a ShardedCounter's value."""
+
+    __slots__ = ("counter",)
+
+    def __init__(self, counter):
         """
-        Get the total number of pizzas created.
-        
-        This class method accesses the class variable total_pizzas_made.
-        
-        Returns:
-            int: Total number of pizzas created
+        Args:
+            counter (ShardedCounter): The counter to expose
         """
-        return cls.total_pizzas_made
+        self.counter = counter
 
+    def __get__(self, instance, owner=None):
+        return self.counter.value
 
-# Using class methods
-print("\nExample 8: Class Methods as Factory Methods")
-pizza1 = Pizza.margherita()
-pizza2 = Pizza.pepperoni()
-pizza3 = Pizza(['BBQ sauce', 'chicken', 'onions'])
 
-print(f"Pizza 1: {pizza1}")
-print(f"Pizza 2: {pizza2}")
-print(f"Pizza 3: {pizza3}")
-print(f"Total pizzas made: {Pizza.get_total_pizzas()}")
+# A recipe's shared, immutable data: its ingredients and its display text
+Recipe = namedtuple("Recipe", "ingredients label")
 
 
-# ============================================================================
-# SECTION 5: ABSTRACT METHODS (@abstractmethod)
-# ============================================================================
+@lru_cache(maxsize=8192)
+def _recipe(ingredients):
+    """
+    Return the one shared Recipe for a combination of ingredients.
 
-print("\n" + "=" * 60)
-print("SECTION 5: ABSTRACT METHODS")
-print("=" * 60)
+    Identical pizzas all point at the same Recipe (a flyweight), so a
+    million margheritas store one ingredient tuple and one repr string.
 
-"""
-What is @abstractmethod?
-------------------------
-An abstract method is a method declared in a base class that must be
+    Args:
+        ingredients (tuple): Ingredient strings
+
+    Returns:
+        Recipe: The interned recipe
+    """
+    return Recipe(ingredients, f"Pizza({', '.join(ingredients)})")
+
+
+def _read_catalog(path, cache=True):
+    """
+    Parse a JSON recipe catalog, using its on-disk cache when it is fresh.
+
+    The catalog maps names to ingredient lists:
+    {"margherita": ["tomato sauce", "mozzarella", "basil"], ...}. The parsed
+    recipes are saved to <path>.cache as compact JSON: every distinct
+    ingredient is stored once, and each recipe is a list of indexes into
+    that list. The cache is plain data (nothing in it is executed) and is
+    only trusted while the catalog's size and modification time are
+    unchanged.
+
+    Args:
+        path (str): The catalog file
+        cache (bool): Read and write the on-disk cache
+
+    Returns:
+        list: (name, ingredients tuple) pairs
+
+    Raises:
+        ValueError: If the catalog isn't a JSON object of ingredient lists
+    """
+    json = _lazy_import("json")
+    stat = os.stat(path)
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    cache_path = path + ".cache"
+    if cache:
+        try:
+            with open(cache_path, encoding="utf-8") as file:
+                cached = json.load(file)
+            if cached["stamp"] == stamp:
+                strings = cached["ingredients"]
+                return [(name, tuple(strings[i] for i in indexes)) for name, indexes in cached["recipes"]]
+        except (OSError, ValueError, TypeError, KeyError, IndexError):
+            pass  # Missing, stale-format or unreadable cache: parse the catalog instead
+
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: a catalog must be a JSON object of recipes")
+    entries = []
+    for name, ingredients in data.items():
+        if not isinstance(ingredients, list) or not all(isinstance(item, str) for item in ingredients):
+            raise ValueError(f"{path}: recipe {name!r} needs a list of ingredient strings")
+        entries.append((name, tuple(ingredients)))
+
+    if cache:
+        index = {}  # ingredient -> its position in the cache's ingredient list
+        recipes = [[name, [index.setdefault(item, len(index)) for item in ingredients]]
+                   for name, ingredients in entries]
+        compact = {"stamp": stamp, "ingredients": list(index), "recipes": recipes}
+        with contextlib.suppress(OSError):  # A read-only folder just means no cache
+            with open(cache_path + ".tmp", "w", encoding="utf-8") as file:
+                json.dump(compact, file, ensure_ascii=False, separators=(",", ":"))
+            os.replace(cache_path + ".tmp", cache_path)
+    return entries
+
+
+class RecipeRegistry:
+    """
+    Named pizza recipes, indexed by name for O(1) lookups.
+
+    Recipes are registered from code or from JSON catalogs. A catalog
+    added with add_catalog() isn't read until a lookup misses the
+    recipes already known, so programs that only use the built-in recipes
+    never pay for it.
+    """
+
+    __slots__ = ("_recipes", "_pending", "_reserved", "_lock")
+
+    def __init__(self):
+        """Start with no recipes."""
+        self._recipes = {}  # name -> Recipe
+        self._pending = []  # (path, cache) of catalogs not read yet
+        self._reserved = frozenset()  # Names a recipe may not take
+        self._lock = threading.Lock()
+
+    def reserve(self, names):
+        """
+        Forbid recipe names that are already taken by something else.
+
+        PizzaMeta reserves the Pizza class's own attributes, since a recipe
+        called 'bulk' would be silently shadowed by Pizza.bulk.
+
+        Args:
+            names: Iterable of names
+
+        Raises:
+            ValueError: If a reserved name is already a registered recipe
+        """
+        names = frozenset(names)
+        with self._lock:
+            taken = sorted(names & self._recipes.keys())
+            if taken:
+                raise ValueError(f"Recipe names {taken} clash with existing attributes!")
+            self._reserved |= names
+
+    def register(self, name, ingredients):
+        """
+        Add a named recipe.
+
+        Registering the same recipe again does nothing.
+
+        Args:
+            name (str): The recipe name, e.g. 'margherita'
+            ingredients (list): List of ingredient strings
+
+        Raises:
+            ValueError: If the name is reserved or already registered with
+                other ingredients
+        """
+        with self._lock:
+            self._add_all([(name, tuple(ingredients))])
+
+    def _add_all(self, entries):
+        """
+        Register a batch of recipes, all or nothing (call with the lock held).
+
+        Args:
+            entries (list): (name, ingredients tuple) pairs
+
+        Raises:
+            ValueError: If a name is reserved or already registered with
+                other ingredients
+        """
+        batch = {}
+        for name, ingredients in entries:
+            if name in self._reserved:
+                raise ValueError(f"Recipe name {name!r} is reserved!")
+            recipe = _recipe(ingredients)
+            if self._recipes.get(name, recipe) != recipe or batch.setdefault(name, recipe) != recipe:
+                raise ValueError(f"Recipe {name!r} is already registered with other ingredients!")
+        self._recipes.update(batch)
+
+    def add_catalog(self, path, cache=True):
+        """
+        Add a JSON catalog of recipes, to be read on first use.
+
+        Args:
+            path (str): The catalog file
+            cache (bool): Keep parsed recipes in <path>.cache for next time
+        """
+        with self._lock:
+            self._pending.append((os.fspath(path), cache))
+
+    def _load_pending(self):
+        """
+        Read every catalog added since the last lookup.
+
+        Lookups that miss call this, so a lookup that races with another
+        thread's load waits for it on the lock instead of missing. A catalog
+        that fails to load registers none of its recipes and is dropped: the
+        error is raised once, and later lookups carry on without it.
+
+        Raises:
+            OSError: If a catalog can't be read
+            ValueError: If a catalog is malformed or conflicts with known recipes
+        """
+        with self._lock:
+            while self._pending:
+                path, cache = self._pending.pop(0)
+                self._add_all(_read_catalog(path, cache))
+
+    def get(self, name):
+        """
+        Look up a recipe by name.
+
+        Args:
+            name (str): The recipe name
+
+        Returns:
+            Recipe: The shared recipe
+
+        Raises:
+            KeyError: If no recipe has that name
+        """
+        recipe = self._recipes.get(name)
+        if recipe is None:
+            self._load_pending()
+            recipe = self._recipes.get(name)
+            if recipe is None:
+                raise KeyError(f"Unknown recipe: {name!r}")
+        return recipe
+
+    def names(self):
+        """
+        List every recipe name, reading pending catalogs first.
+
+        Returns:
+            list: The names, in registration order
+        """
+        self._load_pending()
+        return list(self._recipes)
+
+    def __contains__(self, name):
+        if name not in self._recipes:
+            self._load_pending()
+        return name in self._recipes
+
+    def __len__(self):
+        return len(self.names())
+
+
+class PizzaMeta(type):
+    """
+    Metaclass that turns registered recipe names into factory classmethods.
+
+    Pizza.<name>() works for every recipe in Pizza.recipes. The factory is
+    generated on first access and stored on the class, so later calls are
+    ordinary classmethod calls.
+    """
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        # A recipe named like a class attribute could never be reached
+        if "recipes" in namespace:
+            cls.recipes.reserve(attr for klass in cls.__mro__ for attr in vars(klass))
+        else:
+            cls.recipes.reserve(namespace)
+
+    def __getattr__(cls, name):
+        missing = f"type object {cls.__name__!r} has no attribute {name!r}"
+        if name.startswith("_"):
+            raise AttributeError(missing)
+        try:
+            known = name in cls.recipes
+        except (OSError, ValueError) as error:  # A broken catalog: hasattr() must still work
+            raise AttributeError(missing) from error
+        if not known:
+            raise AttributeError(missing)
+
+        recipe = cls.recipes.get(name)  # Looked up once, when the factory is made
+
+        def factory(cls):
+            pizza = object.__new__(cls)
+            pizza._recipe = recipe
+            Pizza._pizzas_made.add()
+            return pizza
+
+        factory.__name__ = name
+        factory.__qualname__ = f"{cls.__name__}.{name}"
+        factory.__doc__ = f"Factory method to create a {name} pizza."
+        setattr(cls, name, classmethod(factory))
+        return getattr(cls, name)
+
+    def __dir__(cls):
+        return sorted(set(super().__dir__()) | set(cls.recipes.names()))
+
+
+class Pizza(metaclass=PizzaMeta):
+    """
+    A class demonstrating class methods for alternative constructors.
+
+    A pizza only holds a reference to its shared, immutable Recipe, so
+    creating millions of identical pizzas costs one small object each.
+
+    Named recipes live in the Pizza.recipes registry rather than in one
+    hand-written classmethod each: Pizza.margherita() is generated from
+    the registered data, and so is every recipe added later.
+    """
+
+    __slots__ = ("_recipe",)
+    
+    # Class-level statistic (shared by all instances). Pizzas are built by
+    # many threads at once, so it is a ShardedCounter rather than an int;
+    # Pizza.total_pizzas_made still reads as a plain number.
+    _pizzas_made = ShardedCounter()
+    total_pizzas_made = CounterAttribute(_pizzas_made)
+
+    recipes = RecipeRegistry()
+    recipes.register("margherita", ["tomato sauce", "mozzarella", "basil"])
+    recipes.register("pepperoni", ["tomato sauce", "mozzarella", "pepperoni"])
+    
+    def __init__(self, ingredients):
+        """
+        Initialize a Pizza with given ingredients.
+        
+        Args:
+            ingredients (list): List of ingredient strings
+        """
+        self._recipe = _recipe(tuple(ingredients))
+        Pizza._pizzas_made.add()
+
+    @property
+    def ingredients(self):
+        """tuple: The ingredient strings (shared with identical pizzas)."""
+        return self._recipe.ingredients
+    
+    def __repr__(self):
+        """String representation of the pizza (built once per recipe)."""
+        return self._recipe.label
+    
+    @classmethod
+    def from_recipe(cls, name):
+        """
+        Factory method to create a pizza from a registered recipe.
+        
+        This is a class method that acts as an alternative constructor.
+        Instead of Pizza(['tomato sauce', 'mozzarella', 'basil']), you can
+        call Pizza.from_recipe('margherita'), or simply Pizza.margherita().
+        
+        Args:
+            name (str): A name in Pizza.recipes
+        
+        Returns:
+            Pizza: A pizza instance
+        
+        Raises:
+            KeyError: If no recipe has that name
+        """
+        pizza = object.__new__(cls)
+        pizza._recipe = cls.recipes.get(name)
+        Pizza._pizzas_made.add()
+        return pizza
+
+    @classmethod
+    def _recipe_for(cls, recipe):
+        """Resolve a recipe name or an ingredient list to its shared Recipe."""
+        if isinstance(recipe, str):
+            return cls.recipes.get(recipe)
+        return _recipe(tuple(recipe))
+
+    @classmethod
+    def bulk(cls, recipe, n):
+        """
+        Build n identical pizzas in one call.
+
+        The recipe is looked up once and the pizza count is updated once
+        for the whole batch. __init__ is not called for each pizza.
+
+        Args:
+            recipe: A recipe name, or a list of ingredient strings
+            n (int): How many pizzas to build
+
+        Returns:
+            list: n pizzas sharing one Recipe
+        """
+        recipe = cls._recipe_for(recipe)
+        new = object.__new__
+        pizzas = [new(cls) for _ in range(n)]
+        for pizza in pizzas:
+            pizza._recipe = recipe
+        Pizza._pizzas_made.add(len(pizzas))
+        return pizzas
+
+    @classmethod
+    def from_orders(cls, orders):
+        """
+        Build one pizza per order, for a batch of orders.
+
+        orders is consumed one at a time, so it can be a generator over an
+        order stream that is never held in memory as a whole. The pizza
+        count is updated once, after the whole batch is built.
+
+        Args:
+            orders: An iterable of recipe names or ingredient lists
+
+        Returns:
+            list: One pizza per order, in order
+        """
+        recipes = {}  # This batch's recipes, to skip the shared lookups for repeats
+        new = object.__new__
+        pizzas = []
+        append = pizzas.append
+        for order in orders:
+            key = order if isinstance(order, str) else tuple(order)
+            recipe = recipes.get(key)
+            if recipe is None:
+                recipe = recipes[key] = cls._recipe_for(key)
+            pizza = new(cls)
+            pizza._recipe = recipe
+            append(pizza)
+        Pizza._pizzas_made.add(len(pizzas))
+        return pizzas
+    
+    @classmethod
+    def get_total_pizzas(cls):
+        """
+        Get the total number of pizzas created.
+        
+        This class method accesses the class variable total_pizzas_made,
+        which sums the per-thread counts.
+        
+        Returns:
+            int: Total number of pizzas created
+        """
+        return cls.total_pizzas_made
+
+
+def _section_4_examples():
+    """Run the class method examples."""
+    print("\n" + "=" * 60)
+    print("SECTION 4: CLASS METHODS")
+    print("=" * 60)
+
+    print("\nExample 8: Class Methods as Factory Methods")
+    pizza1 = Pizza.margherita()
+    pizza2 = Pizza.pepperoni()
+    pizza3 = Pizza(['BBQ sauce', 'chicken', 'onions'])
+
+    print(f"Pizza 1: {pizza1}")
+    print(f"Pizza 2: {pizza2}")
+    print(f"Pizza 3: {pizza3}")
+    print(f"Total pizzas made: {Pizza.get_total_pizzas()}")
+
+    print("\nExample 8b: Building a Batch of Pizzas in One Call")
+    orders = (name for name in ["margherita", "pepperoni", "margherita"])
+    print(f"From orders: {Pizza.from_orders(orders)}")
+    print(f"In bulk: {Pizza.bulk(['tomato sauce', 'mozzarella'], 2)}")
+    print(f"Total pizzas made: {Pizza.get_total_pizzas()}")
+
+    print("\nExample 8c: Factories Generated from Recipe Data")
+    Pizza.recipes.register("funghi", ["tomato sauce", "mozzarella", "mushrooms"])
+    print(f"Pizza.funghi(): {Pizza.funghi()}")
+    print(f"Known recipes: {Pizza.recipes.names()}")
+
+
+# ============================================================================
+# SECTION 5: ABSTRACT METHODS (@abstractmethod)
+# ============================================================================
+
+"""
+What is @abstractmethod?
+------------------------
+An abstract method is a method declared in a base class that must be
 implemented by any concrete (non-abstract) subclass. It's like a contract.
 
 Use @abstractmethod when:
@@ -501,35 +1355,133 @@ class Bird(Animal):
         print(f"  {self.name} is flying in the sky! 🦅")
 
 
-# Using abstract methods
-print("\nExample 9: Abstract Methods")
-dog = Dog("Buddy")
-dog.make_sound()
-dog.move()
-dog.sleep()
+class Sealed:
+    """
+    Base class for a sealed class hierarchy - an opt-in, faster ABC.
+
+    ABC checks for missing abstract methods every time a class is
+    instantiated, and isinstance() against an ABC goes through
+    ABCMeta.__instancecheck__ and its caches (which register() can
+    invalidate). A Sealed hierarchy is checked once, when each subclass is
+    defined: a concrete subclass that misses an @abstractmethod is a
+    TypeError right away. The classes keep the plain `type` metaclass, so
+    isinstance() takes CPython's native fast path, and every class keeps a
+    precomputed set of its subclasses for exact-type checks and dispatch.
+
+    Mark intermediate classes that stay abstract with `abstract=True`, and
+    call seal() once the hierarchy is complete to forbid new subclasses.
+    """
+
+    __slots__ = ()
 
-print()
-bird = Bird("Tweety")
-bird.make_sound()
-bird.move()
-bird.sleep()
+    def __init_subclass__(cls, abstract=False, **kwargs):
+        """
+        Verify a new subclass and add it to its ancestors' subclass sets.
 
-print("\nExample 10: Cannot instantiate abstract class")
-try:
-    # This will raise an error because Animal is abstract
-    animal = Animal("Generic")
-except TypeError as e:
-    print(f"  ❌ Error: {e}")
+        Args:
+            abstract (bool): The class may leave abstract methods unimplemented
+
+        Raises:
+            TypeError: If a concrete class misses an abstract method, or a
+                parent has been sealed
+        """
+        super().__init_subclass__(**kwargs)
+        names = set(vars(cls))
+        for base in cls.__mro__[1:]:
+            names.update(getattr(base, "__abstractmethods__", ()))
+        missing = sorted(name for name in names if getattr(getattr(cls, name, None), "__isabstractmethod__", False))
+        if missing and not abstract:
+            raise TypeError(f"Can't define concrete class {cls.__name__} without an implementation "
+                            f"for abstract method(s) {', '.join(missing)}")
+
+        ancestors = [base for base in cls.__mro__[1:] if issubclass(base, Sealed) and base is not Sealed]
+        for base in ancestors:
+            if base._sealed:
+                raise TypeError(f"{base.__name__} is sealed - {cls.__name__} can't subclass it")
+
+        # A non-empty __abstractmethods__ makes object.__new__ refuse to
+        # instantiate the class, exactly like ABC does
+        cls.__abstractmethods__ = frozenset(missing)
+        cls._sealed = False
+        cls.subclasses = frozenset({cls})
+        for base in ancestors:
+            base.subclasses |= {cls}
+
+    @classmethod
+    def seal(cls):
+        """Forbid any further subclasses of this class."""
+        cls._sealed = True
+
+
+class SealedAnimal(Sealed, abstract=True):
+    """
+    Animal's interface as a sealed hierarchy (see Sealed).
+
+    It shares Animal's methods; make_sound and move are still abstract.
+    """
+
+    __init__ = Animal.__init__
+    make_sound = Animal.make_sound
+    move = Animal.move
+    sleep = Animal.sleep
+
+
+class SealedDog(SealedAnimal):
+    """Dog, in the sealed hierarchy."""
+
+    make_sound = Dog.make_sound
+    move = Dog.move
+
+
+class SealedBird(SealedAnimal):
+    """Bird, in the sealed hierarchy."""
+
+    make_sound = Bird.make_sound
+    move = Bird.move
+
+
+SealedAnimal.seal()
+
+
+def _section_5_examples():
+    """Run the abstract method examples."""
+    print("\n" + "=" * 60)
+    print("SECTION 5: ABSTRACT METHODS")
+    print("=" * 60)
+
+    print("\nExample 9: Abstract Methods")
+    dog = Dog("Buddy")
+    dog.make_sound()
+    dog.move()
+    dog.sleep()
+
+    print()
+    bird = Bird("Tweety")
+    bird.make_sound()
+    bird.move()
+    bird.sleep()
+
+    print("\nExample 10: Cannot instantiate abstract class")
+    try:
+        # This will raise an error because Animal is abstract
+        animal = Animal("Generic")
+    except TypeError as e:
+        print(f"  ❌ Error: {e}")
+
+    print("\nExample 10b: A Sealed Hierarchy Checks Subclasses When They Are Defined")
+    try:
+        class Fish(SealedAnimal):
+            def move(self):
+                print(f"  {self.name} is swimming! 🐟")
+    except TypeError as e:
+        print(f"  ❌ Error: {e}")
+    print(f"  SealedAnimal subclasses: {sorted(cls.__name__ for cls in SealedAnimal.subclasses)}")
 
 
 # ============================================================================
 # SECTION 6: FUNCTION OVERLOADING (@overload)
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("SECTION 6: FUNCTION OVERLOADING")
-print("=" * 60)
-
 """
 What is @overload?
 ------------------
@@ -541,8 +1493,123 @@ Note: @overload only provides type hints for static type checkers (like mypy).
 You still need to write one actual implementation.
 """
 
+import numbers
 from typing import overload, Union
 
+import functools
+from types import MethodType
+
+
+class TypeDispatcher:
+    """
+    Runtime dispatch on the type of one argument.
+
+    @overload only describes the accepted types to type checkers; the
+    implementation still needs an if/elif isinstance chain. A
+    TypeDispatcher lets each type register its own implementation, just
+    like the @overload stubs declare them, and picks one at call time.
+
+    The implementation for a type is found by walking the type's MRO, so
+    subclasses are covered (bool and IntEnum use the int implementation).
+    The answer is cached per concrete type, so after the first call a
+    dispatch is a single dict lookup no matter how many types are
+    registered.
+    """
+
+    def __init__(self, fallback, arg_index=0):
+        """
+        Initialize a dispatcher.
+
+        Args:
+            fallback: Called when no registered type matches
+            arg_index (int): Position of the argument to dispatch on
+                (1 for methods, to skip self)
+        """
+        self.fallback = fallback
+        self.arg_index = arg_index
+        self.registry = {}
+        self._cache = {}
+        functools.update_wrapper(self, fallback)
+
+    def register(self, cls):
+        """
+        Register the decorated function as the implementation for cls.
+
+        Args:
+            cls (type): The type the implementation handles
+
+        Returns:
+            decorator: Registers a function and returns it unchanged
+        """
+        def decorator(func):
+            self.registry[cls] = func
+            self._cache.clear()
+            return func
+        return decorator
+
+    def dispatch(self, cls):
+        """
+        Find the implementation for a type.
+
+        Args:
+            cls (type): The type of the dispatched argument
+
+        Returns:
+            function: The registered implementation, or the fallback
+        """
+        try:
+            return self._cache[cls]
+        except KeyError:
+            pass
+        impl = self.fallback
+        for base in cls.__mro__:
+            if base in self.registry:
+                impl = self.registry[base]
+                break
+        self._cache[cls] = impl
+        return impl
+
+    def __call__(self, *args, **kwargs):
+        """Call the implementation registered for the argument's type."""
+        cls = type(args[self.arg_index])
+        try:
+            impl = self._cache[cls]
+        except KeyError:
+            impl = self.dispatch(cls)
+        return impl(*args, **kwargs)
+
+    def __get__(self, instance, owner=None):
+        """Bind to an instance when used as a method."""
+        if instance is None:
+            return self
+        return MethodType(self, instance)
+
+
+def type_dispatch(func):
+    """
+    Turn a function into a TypeDispatcher dispatching on its first argument.
+
+    Args:
+        func: The fallback implementation
+
+    Returns:
+        TypeDispatcher: Use .register(cls) to add implementations
+    """
+    return TypeDispatcher(func)
+
+
+def type_dispatch_method(func):
+    """
+    Like type_dispatch, but for methods: dispatches on the argument after self.
+
+    Args:
+        func: The fallback implementation
+
+    Returns:
+        TypeDispatcher: Use .register(cls) to add implementations
+    """
+    return TypeDispatcher(func, arg_index=1)
+
 
 class Calculator:
     """A calculator demonstrating function overloading with type hints."""
@@ -559,6 +1626,81 @@ class Calculator:
         if c is None:
             return a + b
         return a + b + c
+
+    def add_many(self, *operands):
+        """
+        Add any number of operands (N-ary version of add).
+
+        Each operand may be a number, a sequence of numbers or a NumPy
+        array. Scalars are broadcast, sequences are added element-wise and
+        must all have the same length.
+
+        Args:
+            *operands: Numbers, sequences or arrays to add
+
+        Returns:
+            The sum - a number if every operand is a scalar, otherwise a
+            list (or an array if any operand was an array)
+
+        Raises:
+            TypeError: If an element is not a number, listing the
+                (operand, position) of every such element (position is None
+                for an operand that is neither a number nor a sequence)
+            ValueError: If the sequences have different lengths
+        """
+        if not operands:
+            raise TypeError("add_many() needs at least one operand")
+
+        np = _lazy_import("np")
+        # NumPy scalars (np.int64(3), ...) broadcast like Python numbers
+        scalar = numbers.Number if np is None else (numbers.Number, np.generic)
+        element = numbers.Number if np is None else (numbers.Number, np.bool_)
+        columns = [op for op in operands if not isinstance(op, scalar)]
+        if not columns:
+            return sum(operands[1:], operands[0])
+
+        # An operand like None has no length to compare: report it before
+        # the length check, in the same form as a bad element
+        bad = [(index, None) for index, op in enumerate(operands)
+               if not isinstance(op, scalar) and not (hasattr(op, "__len__") and hasattr(op, "__iter__"))]
+        if bad:
+            raise TypeError(f"Operands must be numbers (unsupported elements at (operand, position) {bad})")
+
+        length = len(columns[0])
+        if any(len(column) != length for column in columns):
+            raise ValueError("All sequences must have the same length!")
+
+        # Check every element up front, so bad input is the same TypeError
+        # whichever path adds it
+        bad = [(index, position)
+               for index, op in enumerate(operands)
+               if not isinstance(op, scalar) and not (np is not None and isinstance(op, np.ndarray)
+                                                      and op.dtype.kind in "biufc")
+               for position, value in enumerate(op) if not isinstance(value, element)]
+        if bad:
+            raise TypeError(f"Operands must be numbers (unsupported elements at (operand, position) {bad})")
+
+        as_array = np is not None and any(isinstance(op, np.ndarray) for op in operands)
+        if as_array:
+            arrays = [np.asarray(op) for op in operands]
+            if all(array.dtype.kind in "biu" for array in arrays):
+                # Integers add in int64 while the largest possible total
+                # fits; otherwise in Python ints (an object array)
+                bound = sum(max(abs(int(array.min())), abs(int(array.max()))) for array in arrays if array.size)
+                arrays = [array.astype(np.int64 if bound < (1 << 63) else object) for array in arrays]
+            if all(array.dtype.kind in "biufcO" for array in arrays):
+                total = arrays[0]
+                for array in arrays[1:]:
+                    total = np.add(total, array)
+                return total
+
+        def python_value(value):
+            return value.item() if np is not None and isinstance(value, np.generic) else value
+
+        rows = [[python_value(op)] * length if isinstance(op, scalar) else [python_value(value) for value in op]
+                for op in operands]
+        totals = [sum(values[1:], values[0]) for values in zip(*rows)]
+        return np.array(totals) if as_array else totals
     
     @overload
     def process(self, value: int) -> int:
@@ -570,12 +1712,15 @@ class Calculator:
         """Process a string."""
         ...
     
+    @type_dispatch_method
     def process(self, value: Union[int, str]) -> Union[int, str]:
         """
         Process a value (actual implementation).
         
         The @overload decorators above are just type hints.
-        This is the actual implementation that handles both cases.
+        The real work is done by one implementation per type, registered
+        below with @process.register - this fallback only runs for
+        unsupported types.
         
         Args:
             value: Either an int or a str
@@ -584,34 +1729,130 @@ class Calculator:
             If int: returns value * 2
             If str: returns value in uppercase
         """
-        if isinstance(value, int):
-            print(f"  Processing integer: {value}")
-            return value * 2
-        elif isinstance(value, str):
-            print(f"  Processing string: {value}")
-            return value.upper()
-        else:
-            raise TypeError("Value must be int or str")
+        raise TypeError("Value must be int or str")
+    
+    @process.register(int)
+    def _process_int(self, value: int) -> int:
+        """Process an integer (also used for bool and IntEnum)."""
+        print(f"  Processing integer: {value}")
+        return value * 2
+    
+    @process.register(str)
+    def _process_str(self, value: str) -> str:
+        """Process a string."""
+        print(f"  Processing string: {value}")
+        return value.upper()
+
+    def process_many(self, values):
+        """
+        Process a whole batch of ints and strings at once.
+
+        Gives the same results as calling process() on every element, but
+        splits the batch by type first: all ints are doubled with a single
+        vectorized NumPy operation, all strings are uppercased in one pass,
+        and the results are put back in the original order. Nothing is
+        printed per element.
+
+        Args:
+            values: An iterable (or NumPy array) of ints and strings
 
+        Returns:
+            list: The processed values, in input order (an integer or
+            string NumPy array gives back an array of the same kind)
+
+        Raises:
+            TypeError: If any element is neither int nor str, listing the
+                positions of every unsupported element
+        """
+        np = _lazy_import("np")
+        if np is not None and isinstance(values, np.ndarray) and values.dtype.kind in "biuU":
+            # Homogeneous arrays never need splitting
+            if values.dtype.kind == "U":
+                return np.char.upper(values)
+            # Same rule as _double_ints(): int64 while doubling can't
+            # overflow it, otherwise exact Python ints (an object array)
+            if not values.size or (-(1 << 62) <= int(values.min()) and int(values.max()) < (1 << 62)):
+                return values.astype(np.int64) * 2
+            return values.astype(object) * 2
+        values = values if isinstance(values, (list, tuple)) else list(values)
+
+        int_positions, str_positions, bad = [], [], []
+        for position, value in enumerate(values):
+            if isinstance(value, int):
+                int_positions.append(position)
+            elif isinstance(value, str):
+                str_positions.append(position)
+            else:
+                bad.append(position)
+        if bad:
+            raise TypeError(f"Value must be int or str (unsupported elements at positions {bad})")
+
+        ints = [values[i] for i in int_positions]
+        strings = [values[i] for i in str_positions]
+        results = [None] * len(values)
+        for position, result in zip(int_positions, _double_ints(ints)):
+            results[position] = result
+        for position, result in zip(str_positions, map(str.upper, strings)):
+            results[position] = result
+        return results
+
+
+def _double_ints(ints):
+    """
+    Double a list of Python ints, vectorized when NumPy can hold them.
 
-# Using overloaded functions
-print("\nExample 11: Function Overloading")
-calc = Calculator()
-result1 = calc.process(5)
-print(f"  Result: {result1}")
+    Args:
+        ints (list): The integers to double
 
-result2 = calc.process("hello")
-print(f"  Result: {result2}")
+    Returns:
+        list: Each value times two, as Python ints
+    """
+    np = _lazy_import("np")
+    if np is not None and ints:
+        try:
+            column = np.array(ints, dtype=np.int64)
+        except OverflowError:
+            column = None
+        # Doubling stays inside int64 as long as |value| < 2**62
+        if column is not None and -(1 << 62) <= column.min() and column.max() < (1 << 62):
+            return (column * 2).tolist()
+    return [value * 2 for value in ints]
+
+
+def _section_6_examples():
+    """Run the function overloading examples."""
+    print("\n" + "=" * 60)
+    print("SECTION 6: FUNCTION OVERLOADING")
+    print("=" * 60)
+
+    print("\nExample 11: Function Overloading")
+    calc = Calculator()
+    result1 = calc.process(5)
+    print(f"  Result: {result1}")
+
+    result2 = calc.process("hello")
+    print(f"  Result: {result2}")
+
+    print("\nExample 11b: Type dispatch covers subclasses")
+    print(f"  Result for True: {calc.process(True)}")  # bool is a subclass of int
+    try:
+        calc.process(3.5)
+    except TypeError as e:
+        print(f"  ❌ Error: {e}")
+
+    print("\nExample 11c: Batch processing")
+    print(f"  process_many: {calc.process_many([5, 'hello', 7, 'world'])}")
+    print(f"  add_many:     {calc.add_many([1, 2, 3], [10, 20, 30], 100)}")
+    try:
+        calc.process_many([1, "a", 2.5, None])
+    except TypeError as e:
+        print(f"  ❌ Error: {e}")
 
 
 # ============================================================================
 # SECTION 7: FINAL CLASSES AND METHODS (@final)
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("SECTION 7: FINAL DECORATOR")
-print("=" * 60)
-
 """
 What is @final?
 ---------------
@@ -682,31 +1923,32 @@ class SecretAlgorithm:
         print("  🔒 Processing with secret algorithm...")
 
 
-# Using final decorator
-print("\nExample 12: Final Methods")
-game = MyGame()
-game.start()
-score = game.calculate_score(50)
-print(f"  Final score: {score}")
-game.end()
+def _section_7_examples():
+    """Run the @final examples."""
+    print("\n" + "=" * 60)
+    print("SECTION 7: FINAL DECORATOR")
+    print("=" * 60)
+
+    print("\nExample 12: Final Methods")
+    game = MyGame()
+    game.start()
+    score = game.calculate_score(50)
+    print(f"  Final score: {score}")
+    game.end()
 
-print("\nExample 13: Final Class")
-secret = SecretAlgorithm()
-secret.process()
+    print("\nExample 13: Final Class")
+    secret = SecretAlgorithm()
+    secret.process()
 
-# If you uncomment this, a type checker would warn you:
-# class MySecretAlgorithm(SecretAlgorithm):  # ❌ Type checker warning
-#     pass
+    # If you uncomment this, a type checker would warn you:
+    # class MySecretAlgorithm(SecretAlgorithm):  # ❌ Type checker warning
+    #     pass
 
 
 # ============================================================================
 # SECTION 8: OVERRIDE DECORATOR (@override)
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("SECTION 8: OVERRIDE DECORATOR")
-print("=" * 60)
-
 """
 What is @override?
 ------------------
@@ -718,11 +1960,26 @@ catch errors where you think you're overriding a method but actually aren't
 Note: If your Python version is < 3.12, you can use typing_extensions.
 """
 
+from typing import TYPE_CHECKING
+
 try:
     from typing import override
 except ImportError:
-    # For Python < 3.12, use typing_extensions
-    from typing_extensions import override
+    # For Python < 3.12, type checkers use typing_extensions. At runtime
+    # override() only sets __override__ = True on the method, so we do the
+    # same here instead of importing all of typing_extensions.
+    if TYPE_CHECKING:
+        from typing_extensions import override
+    else:
+        def override(method):
+            """Mark a method as overriding a parent method."""
+            try:
+                method.__override__ = True
+            except (AttributeError, TypeError):
+                pass
+            return method
+
+import math
 
 
 class Shape:
@@ -806,7 +2063,6 @@ class Circle(Shape):
         Returns:
             float: π * radius²
         """
-        import math
         return math.pi * self.radius ** 2
     
     @override
@@ -817,31 +2073,262 @@ class Circle(Shape):
         Returns:
             float: 2 * π * radius
         """
-        import math
         return 2 * math.pi * self.radius
 
 
-# Using override decorator
-print("\nExample 14: Override Decorator")
-rect = Rectangle(5, 3)
-print(f"Rectangle (5x3):")
-print(f"  Area: {rect.area():.2f}")
-print(f"  Perimeter: {rect.perimeter():.2f}")
+class ShapeArray(ABC):
+    """
+    Base class for columnar (vectorized) collections of shapes.
 
-print()
-circle = Circle(4)
-print(f"Circle (radius=4):")
-print(f"  Area: {circle.area():.2f}")
-print(f"  Perimeter: {circle.perimeter():.2f}")
+    Instead of one Python object per shape, a ShapeArray keeps every
+    dimension in a contiguous float64 NumPy array, so area() and
+    perimeter() run once for the whole batch instead of once per shape.
+    The formulas are written exactly like the scalar methods, so the
+    results are bit-identical to calling Rectangle.area()/Circle.area()
+    on each shape.
 
+    ShapeArray is abstract: every subclass implements __len__, area,
+    perimeter, from_shapes and to_shapes.
 
-# ============================================================================
-# BONUS SECTION: COMBINING DECORATORS
-# ============================================================================
+    Requires NumPy (pip install numpy).
+    """
+
+    # The scalar Shape subclass this array mirrors (set by subclasses)
+    shape_class = Shape
+
+    @staticmethod
+    def _column(values) -> "np.ndarray":
+        """
+        Convert values to a contiguous 1-D float64 array.
+
+        Args:
+            values: Any sequence or array of numbers
+
+        Returns:
+            np.ndarray: A contiguous float64 array
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        np = _lazy_import("np")
+        if np is None:
+            raise ImportError("ShapeArray requires NumPy: pip install numpy")
+        return np.ascontiguousarray(values, dtype=np.float64).reshape(-1)
+
+    @classmethod
+    @abstractmethod
+    def from_shapes(cls, shapes):
+        """
+        Build an array from scalar shape instances.
+
+        Args:
+            shapes: An iterable of shape_class objects
+
+        Returns:
+            ShapeArray: The columnar version of the shapes
+        """
+
+    @abstractmethod
+    def to_shapes(self) -> list:
+        """
+        Convert back to a list of scalar shape instances.
+
+        Returns:
+            list: One shape_class object per row
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of shapes in the array."""
+
+    @abstractmethod
+    def area(self) -> "np.ndarray":
+        """
+        Calculate the area of every shape in one call.
+
+        Returns:
+            np.ndarray: Areas as float64
+        """
+
+    @abstractmethod
+    def perimeter(self) -> "np.ndarray":
+        """
+        Calculate the perimeter of every shape in one call.
+
+        Returns:
+            np.ndarray: Perimeters as float64
+        """
+
+    def __repr__(self) -> str:
+        """String representation of the shape array."""
+        return f"{type(self).__name__}(n={len(self)})"
+
+
+class RectangleArray(ShapeArray):
+    """A batch of rectangles stored as width and height columns."""
+
+    shape_class = Rectangle
+
+    def __init__(self, widths, heights):
+        """
+        Initialize a rectangle array.
+
+        Args:
+            widths: Sequence or array of rectangle widths
+            heights: Sequence or array of rectangle heights
+
+        Raises:
+            ValueError: If widths and heights have different lengths
+        """
+        self.widths = self._column(widths)
+        self.heights = self._column(heights)
+        if self.widths.shape != self.heights.shape:
+            raise ValueError("widths and heights must have the same length!")
+
+    @classmethod
+    def from_shapes(cls, rectangles):
+        """
+        Build a RectangleArray from Rectangle instances.
+
+        Args:
+            rectangles: An iterable of Rectangle objects
+
+        Returns:
+            RectangleArray: The columnar version of the rectangles
+        """
+        rectangles = list(rectangles)
+        return cls([r.width for r in rectangles], [r.height for r in rectangles])
+
+    def to_shapes(self) -> list:
+        """
+        Convert back to a list of Rectangle instances.
+
+        Returns:
+            list: One Rectangle per row (dimensions as Python floats)
+        """
+        return [Rectangle(w, h) for w, h in zip(self.widths.tolist(), self.heights.tolist())]
+
+    def __len__(self) -> int:
+        """Number of rectangles in the array."""
+        return len(self.widths)
+
+    @override
+    def area(self) -> "np.ndarray":
+        """
+        Calculate every rectangle's area at once.
+
+        Returns:
+            np.ndarray: Width times height for each rectangle
+        """
+        return self.widths * self.heights
+
+    @override
+    def perimeter(self) -> "np.ndarray":
+        """
+        Calculate every rectangle's perimeter at once.
+
+        Returns:
+            np.ndarray: 2 * (width + height) for each rectangle
+        """
+        return 2 * (self.widths + self.heights)
+
+
+class CircleArray(ShapeArray):
+    """A batch of circles stored as a radius column."""
+
+    shape_class = Circle
+
+    def __init__(self, radii):
+        """
+        Initialize a circle array.
+
+        Args:
+            radii: Sequence or array of circle radii
+        """
+        self.radii = self._column(radii)
+
+    @classmethod
+    def from_shapes(cls, circles):
+        """
+        Build a CircleArray from Circle instances.
+
+        Args:
+            circles: An iterable of Circle objects
+
+        Returns:
+            CircleArray: The columnar version of the circles
+        """
+        return cls([c.radius for c in circles])
+
+    def to_shapes(self) -> list:
+        """
+        Convert back to a list of Circle instances.
+
+        Returns:
+            list: One Circle per row (radius as a Python float)
+        """
+        return [Circle(r) for r in self.radii.tolist()]
+
+    def __len__(self) -> int:
+        """Number of circles in the array."""
+        return len(self.radii)
 
-print("\n" + "=" * 60)
-print("BONUS: COMBINING MULTIPLE DECORATORS")
-print("=" * 60)
+    @override
+    def area(self) -> "np.ndarray":
+        """
+        Calculate every circle's area at once.
+
+        Returns:
+            np.ndarray: π * radius² for each circle
+        """
+        # radii ** 2 would take NumPy's x*x fast path, which can differ from
+        # Python's float.__pow__ in the last bit; float_power calls pow()
+        # per element just like Circle.area() does.
+        return math.pi * _lazy_import("np").float_power(self.radii, 2)
+
+    @override
+    def perimeter(self) -> "np.ndarray":
+        """
+        Calculate every circle's circumference at once.
+
+        Returns:
+            np.ndarray: 2 * π * radius for each circle
+        """
+        return 2 * math.pi * self.radii
+
+
+def _section_8_examples():
+    """Run the @override examples."""
+    print("\n" + "=" * 60)
+    print("SECTION 8: OVERRIDE DECORATOR")
+    print("=" * 60)
+
+    print("\nExample 14: Override Decorator")
+    rect = Rectangle(5, 3)
+    print(f"Rectangle (5x3):")
+    print(f"  Area: {rect.area():.2f}")
+    print(f"  Perimeter: {rect.perimeter():.2f}")
+
+    print()
+    circle = Circle(4)
+    print(f"Circle (radius=4):")
+    print(f"  Area: {circle.area():.2f}")
+    print(f"  Perimeter: {circle.perimeter():.2f}")
+
+    print("\nExample 15: Vectorized shapes (ShapeArray)")
+    if _lazy_import("np") is None:
+        print("  ⚠️  NumPy is not installed - skipping ShapeArray example")
+    else:
+        rects = RectangleArray.from_shapes([Rectangle(5, 3), Rectangle(2, 8)])
+        circles = CircleArray([1, 4])
+        print(f"  {rects}: areas={rects.area()}, perimeters={rects.perimeter()}")
+        print(f"  {circles}: areas={circles.area()}")
+        print(f"  Back to objects: {[c.radius for c in circles.to_shapes()]}")
+
+
+# ============================================================================
+# BONUS SECTION: COMBINING DECORATORS
+# ============================================================================
 
 """
 You can stack multiple decorators on the same function or method.
@@ -867,17 +2354,735 @@ def calculate(x: int):
     return x * 2
 
 
-print(calculate(10))
+def _combining_examples():
+    """Run the stacked decorator example."""
+    print("\n" + "=" * 60)
+    print("BONUS: COMBINING MULTIPLE DECORATORS")
+    print("=" * 60)
+
+    print(calculate(10))
+
 
 # ============================================================================
-# SUMMARY AND BEST PRACTICES
+# BONUS SECTION: FAST, SIGNATURE-PRESERVING DECORATORS
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("SUMMARY AND BEST PRACTICES")
-print("=" * 60)
+"""
+The decorators above build generic closures. That has three costs:
+- wrapper(*args, **kwargs) packs and unpacks the arguments on every call
+- the wrapper's name, docstring and signature replace the original ones
+- a wrapper with a fixed signature (like my_decorator's wrapper()) silently
+  drops arguments
+
+make_decorator() builds wrappers whose parameter list is an exact copy of
+the wrapped function's, so arguments are passed straight through. A
+decorator with no hooks at all returns the function unchanged - the
+cheapest wrapper is no wrapper.
+
+Stacked decorators normally cost one Python frame each. When several
+make_decorator decorators are stacked (or combined with compose()), their
+hooks are fused into ONE generated wrapper that runs them in the same
+bottom-to-top order.
+"""
+
+import weakref
+
+# Generated wrapper -> (wrapped function, layers). Kept outside the wrapper
+# so functools.wraps() in another decorator can't copy it: only a wrapper
+# _compile_wrapper() really built can be fused with further layers.
+_FUSED_WRAPPERS = weakref.WeakKeyDictionary()
+
+def _render_signature(func, reserved):
+    """
+    Render a function's parameters as source code.
+
+    Args:
+        func: The function whose signature to copy
+        reserved (set): Names the generated code uses internally
+
+    Returns:
+        tuple: (parameter list source, call arguments source)
+
+    Raises:
+        ValueError: If a parameter name clashes with a reserved name
+    """
+    params, call = [], []
+    star_written = False
+    previous = None
+    # Don't follow __wrapped__: the defaults are copied from func itself
+    for param in inspect.signature(func, follow_wrapped=False).parameters.values():
+        if param.name in reserved:
+            raise ValueError(f"Parameter name {param.name!r} is reserved")
+        if previous is param.POSITIONAL_ONLY and param.kind is not param.POSITIONAL_ONLY:
+            params.append("/")
+        if param.kind is param.VAR_POSITIONAL:
+            params.append(f"*{param.name}")
+            call.append(f"*{param.name}")
+            star_written = True
+        elif param.kind is param.KEYWORD_ONLY:
+            if not star_written:
+                params.append("*")
+                star_written = True
+            params.append(param.name)
+            call.append(f"{param.name}={param.name}")
+        elif param.kind is param.VAR_KEYWORD:
+            params.append(f"**{param.name}")
+            call.append(f"**{param.name}")
+        else:
+            params.append(param.name)
+            call.append(param.name)
+        previous = param.kind
+    if previous is inspect.Parameter.POSITIONAL_ONLY:
+        params.append("/")
+    return ", ".join(params), ", ".join(call)
+
+
+class MultiplyBy:
+    """
+    A result transform that multiplies the result by a constant.
+
+    It behaves like lambda result: result * factor, but generated wrappers
+    inline it as "_result = _result * factor", so it costs no extra call.
+    """
+
+    __slots__ = ("factor",)
+
+    def __init__(self, factor):
+        """
+        Initialize the transform.
+
+        Args:
+            factor: The value to multiply results by
+        """
+        self.factor = factor
+
+    def __call__(self, result):
+        """Multiply result by the factor."""
+        return result * self.factor
+
+    def __repr__(self) -> str:
+        """String representation of the transform."""
+        return f"MultiplyBy({self.factor!r})"
+
+
+def _compile_wrapper(func, layers):
+    """
+    Generate one wrapper for func with exactly the same parameters.
+
+    Each layer is a (before, after, transform) triple of optional hooks,
+    innermost first - one layer per stacked decorator. All layers run in a
+    single generated frame, in the same order as real nested wrappers.
+    Coroutine functions get an "async def" wrapper that awaits them.
+    For def calculate(x) with two layers the source looks like this:
+
+        def _wrapper(x):
+            _before_1()
+            _before_0()
+            _result = _func(x)
+            _result = _transform_0(_result)
+            _after_0()
+            _result = _result * _factor_1
+            return _result
+
+    Args:
+        func: The function to wrap
+        layers (tuple): (before, after, transform) triples, innermost first
+
+    Returns:
+        function: The wrapper, or func itself when there are no hooks
+    """
+    layers = tuple(layer for layer in layers if any(layer))
+    if not layers:
+        return func
+
+    namespace = {"_func": func}
+    before_lines, after_lines = [], []
+    for i, (before, after, transform) in enumerate(layers):
+        if before:
+            namespace[f"_before_{i}"] = before
+            before_lines.insert(0, f"    _before_{i}()")  # outer layers run first
+        if isinstance(transform, MultiplyBy):
+            namespace[f"_factor_{i}"] = transform.factor
+            after_lines.append(f"    _result = _result * _factor_{i}")
+        elif transform:
+            namespace[f"_transform_{i}"] = transform
+            after_lines.append(f"    _result = _transform_{i}(_result)")
+        if after:
+            namespace[f"_after_{i}"] = after
+            after_lines.append(f"    _after_{i}()")
+
+    # Builtins, partials and callable objects keep their defaults out of
+    # reach, and a parameter may clash with our names: for those, fall back
+    # to the generic *args/**kwargs form
+    params, call = "*args, **kwargs", "*args, **kwargs"
+    exact = False
+    if inspect.isfunction(func):
+        try:
+            params, call = _render_signature(func, set(namespace) | {"_result", "_wrapper"})
+            exact = True
+        except ValueError:
+            pass
+
+    # A coroutine function needs an async wrapper that awaits it
+    is_async = inspect.iscoroutinefunction(func)
+    define, call_func = ("async def", "await _func") if is_async else ("def", "_func")
+    lines = [f"{define} _wrapper({params}):", *before_lines]
+    if after_lines:
+        lines += [f"    _result = {call_func}({call})", *after_lines, "    return _result"]
+    else:
+        lines.append(f"    return {call_func}({call})")
+
+    name = getattr(func, "__qualname__", type(func).__qualname__)
+    exec(compile("\n".join(lines), f"<wrapper of {name}>", "exec"), namespace)
+    wrapper = namespace["_wrapper"]
+    if exact:
+        wrapper.__defaults__ = func.__defaults__
+        wrapper.__kwdefaults__ = func.__kwdefaults__
+    functools.update_wrapper(wrapper, func)
+    # Remember how the wrapper was built so further layers can be fused in
+    _FUSED_WRAPPERS[wrapper] = (func, layers)
+    return wrapper
+
+
+def decorator_layers(func):
+    """
+    Return the make_decorator layers fused into a generated wrapper.
+
+    Args:
+        func: Any callable
+
+    Returns:
+        tuple: (before, after, transform) triples, innermost first, or ()
+        if func isn't a wrapper built by make_decorator()
+    """
+    try:
+        return _FUSED_WRAPPERS[func][1]
+    except (KeyError, TypeError):
+        return ()
+
+
+def make_decorator(before=None, after=None, transform=None):
+    """
+    Build a decorator from simple hooks.
+
+    The resulting wrappers keep the decorated function's name, docstring
+    and exact signature, and never repack *args/**kwargs. Stacking several
+    make_decorator decorators fuses them into a single wrapper frame.
+
+    Args:
+        before: Optional zero-argument callable run before each call
+        after: Optional zero-argument callable run after each call
+        transform: Optional one-argument callable applied to the result
+            (use MultiplyBy(n) to have it inlined)
+
+    Returns:
+        decorator: A decorator that can be used with @ syntax
+
+    Example:
+        double = make_decorator(transform=MultiplyBy(2))
+    """
+    layer = (before, after, transform)
+
+    def decorator(func):
+        if isinstance(func, (staticmethod, classmethod)):
+            return type(func)(decorator(func.__func__))
+        # If func is already a generated wrapper this rebuilds one fused frame
+        return _apply_layers(func, [layer])
+
+    decorator.layer = layer
+    return decorator
+
+
+def compose(*decorators):
+    """
+    Combine several decorators into one.
+
+    compose(a, b)(func) is the same as stacking
+
+        @a
+        @b
+        def func(): ...
+
+    so decorators are applied bottom to top, exactly as the tutorial shows.
+    Runs of make_decorator decorators are compiled into a single wrapper
+    frame; any other decorator is simply applied in its place.
+
+    Args:
+        *decorators: Decorators, outermost first
+
+    Returns:
+        decorator: The combined decorator
+    """
+    def decorator(func):
+        pending = []
+        for dec in reversed(decorators):
+            if hasattr(dec, "layer") and not isinstance(func, (staticmethod, classmethod)):
+                pending.append(dec.layer)
+                continue
+            func = _apply_layers(func, pending)
+            pending = []
+            func = dec(func)
+        return _apply_layers(func, pending)
+    return decorator
+
+
+def _apply_layers(func, layers):
+    """
+    Wrap func in the given layers, fusing with an existing generated wrapper.
+
+    Args:
+        func: A function (possibly a make_decorator wrapper)
+        layers (list): (before, after, transform) triples, innermost first
+
+    Returns:
+        function: The fused wrapper
+    """
+    if not layers:
+        return func
+    try:
+        inner_func, inner_layers = _FUSED_WRAPPERS[func]
+    except (KeyError, TypeError):
+        # Not a generated wrapper (perhaps one that copied a generated
+        # wrapper's attributes, like memoize): wrap it as it is
+        return _compile_wrapper(func, tuple(layers))
+    return _compile_wrapper(inner_func, inner_layers + tuple(layers))
+
+
+def _fast_decorator_examples():
+    """Run the make_decorator() and compose() examples."""
+    print("\n" + "=" * 60)
+    print("BONUS: FAST, SIGNATURE-PRESERVING DECORATORS")
+    print("=" * 60)
+
+    print("\nExample 16: Signature-preserving decorators")
+    announce = make_decorator(
+        before=lambda: print("  🎁 Before the call"),
+        after=lambda: print("  🎁 After the call"),
+    )
+
+    @announce
+    def greet_politely(name, *, greeting="Hello"):
+        """Greet someone with a configurable greeting."""
+        print(f"  {greeting}, {name}!")
+
+    greet_politely("Alice", greeting="Good morning")
+    print(f"  Name kept: {greet_politely.__name__}")
+    print(f"  Signature kept: {inspect.signature(greet_politely)}")
+    print(f"  Docstring kept: {greet_politely.__doc__}")
+
+    passthrough = make_decorator()
+    print(f"  No hooks -> no wrapper: {passthrough(calculate) is calculate}")
+
+    print("\nExample 17: Fusing stacked decorators")
+    fast_multiply_decorator = make_decorator(transform=MultiplyBy(2))
+    fast_other_decorator = make_decorator(transform=MultiplyBy(4))
+
+    @fast_multiply_decorator
+    @fast_other_decorator
+    def fast_calculate(x: int):
+        return x * 2
+
+    # compose() builds the same fused stack without the @ syntax
+    def double(x: int):
+        return x * 2
+
+    composed_calculate = compose(fast_multiply_decorator, fast_other_decorator)(double)
+    print(f"  calculate(10) = {calculate(10)}, fast_calculate(10) = {fast_calculate(10)}, "
+          f"composed(10) = {composed_calculate(10)}")
+    print(f"  Layers fused into one frame: {len(decorator_layers(fast_calculate))}")
+
+
+"""
+Memoization
+-----------
+A pure function always returns the same result for the same arguments,
+so we can remember (cache) results instead of recomputing them. memoize()
+works like functools.lru_cache, plus a time-to-live (TTL) and eviction
+statistics for tuning the cache size.
+"""
+
+import time
+from collections import OrderedDict
+
+CacheInfo = namedtuple("CacheInfo", "hits misses evictions expirations maxsize currsize")
+
+_MISSING = object()
+_KWARGS_MARK = object()  # separates positional from keyword args in cache keys
+
+
+def memoize(maxsize=128, ttl=None, timer=time.monotonic):
+    """
+    A caching decorator with LRU and TTL eviction.
+
+    Works on plain functions, static methods and instance methods (for
+    methods, self is part of the key, so the cache keeps instances alive
+    like functools.lru_cache does). All cache access is guarded by a lock;
+    the function itself runs outside the lock, so two threads missing the
+    same key at once may both compute it. For coroutine functions the
+    awaited result is cached.
+
+    Args:
+        maxsize (int): Maximum number of cached results (None = unbounded).
+            The least recently used entry is evicted first.
+        ttl (float): Seconds a result stays valid (None = forever)
+        timer: Clock used for TTL checks (defaults to time.monotonic)
+
+    Returns:
+        decorator: A decorator adding cache_info() and cache_clear()
+    """
+    def decorator(func):
+        if isinstance(func, (staticmethod, classmethod)):
+            return type(func)(decorator(func.__func__))
+
+        cache = OrderedDict()  # key -> (expires_at, result), oldest first
+        lock = threading.Lock()
+        stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+        def make_key(args, kwargs):
+            key = args
+            if kwargs:
+                key += (_KWARGS_MARK, *sorted(kwargs.items()))
+            return key
+
+        def lookup(key):
+            """Return the cached result for key, or _MISSING."""
+            with lock:
+                entry = cache.get(key, _MISSING)
+                if entry is not _MISSING:
+                    expires_at, result = entry
+                    if expires_at is None or timer() < expires_at:
+                        cache.move_to_end(key)
+                        stats["hits"] += 1
+                        return result
+                    del cache[key]
+                    stats["expirations"] += 1
+                stats["misses"] += 1
+                return _MISSING
+
+        def store(key, result):
+            """
+            Cache result under key, evicting the oldest entry if full.
+
+            With a TTL, expired entries at the least recently used end are
+            dropped first, so keys that are never looked up again don't
+            pile up in an unbounded cache.
+            """
+            with lock:
+                expires_at = None
+                if ttl is not None:
+                    now = timer()
+                    expires_at = now + ttl
+                    while cache and next(iter(cache.values()))[0] <= now:
+                        cache.popitem(last=False)
+                        stats["expirations"] += 1
+                cache[key] = (expires_at, result)
+                cache.move_to_end(key)
+                if maxsize is not None and len(cache) > maxsize:
+                    cache.popitem(last=False)
+                    stats["evictions"] += 1
+
+        if inspect.iscoroutinefunction(func):
+            # Cache the awaited result, not the (single-use) coroutine object
+            async def wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+                result = lookup(key)
+                if result is _MISSING:
+                    result = await func(*args, **kwargs)
+                    store(key, result)
+                return result
+        else:
+            def wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+                result = lookup(key)
+                if result is _MISSING:
+                    result = func(*args, **kwargs)
+                    store(key, result)
+                return result
+
+        def cache_info():
+            """Return a CacheInfo snapshot of the cache statistics."""
+            with lock:
+                return CacheInfo(maxsize=maxsize, currsize=len(cache), **stats)
+
+        def cache_clear():
+            """Empty the cache and reset the statistics."""
+            with lock:
+                cache.clear()
+                stats.update(dict.fromkeys(stats, 0))
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return functools.update_wrapper(wrapper, func)
+    return decorator
+
 
-print("""
+class CachedCalculator(Calculator):
+    """A Calculator whose process() results are cached per instance and value."""
+
+    process = memoize(maxsize=1024, ttl=60)(Calculator.process)
+
+
+def _memoize_examples():
+    """Run the memoize() examples."""
+    print("\nExample 18: Memoization with LRU/TTL eviction")
+    cached_add = memoize(maxsize=2)(MathOperations.add)
+    for x, y in [(1, 2), (1, 2), (3, 4), (5, 6), (1, 2)]:
+        cached_add(x, y)
+    print(f"  {cached_add.cache_info()}")
+
+    cached_calc = CachedCalculator()
+    cached_calc.process(21)   # prints "Processing integer: 21" (miss)
+    cached_calc.process(21)   # served from the cache, nothing printed
+    print(f"  {CachedCalculator.process.cache_info()}")
+
+
+"""
+Async-Aware Decorators
+----------------------
+Calling an "async def" function does not run it - it returns a coroutine
+that must be awaited. A plain wrapper that just calls func() would hand
+back that coroutine unawaited. The decorators in this tutorial check
+inspect.iscoroutinefunction(func) and build an async wrapper instead.
+
+repeat() goes one step further: for coroutines, its N calls run
+concurrently with asyncio.gather, so N I/O-bound calls take about as long
+as one.
+"""
+
+import atexit
+
+_LAZY_IMPORTS.update(
+    asyncio="asyncio",
+    pickle="pickle",
+    BrokenExecutor="concurrent.futures:BrokenExecutor",
+    ProcessPoolExecutor="concurrent.futures:ProcessPoolExecutor",
+    ThreadPoolExecutor="concurrent.futures:ThreadPoolExecutor",
+)
+
+_EXECUTORS = ("serial", "thread", "process")
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _shared_pool(kind):
+    """
+    Return the shared thread or process pool, creating it on first use.
+
+    All repeat(..., executor=...) wrappers share one pool per kind, so a
+    call never pays for starting worker threads or processes.
+
+    Args:
+        kind (str): "thread" or "process"
+
+    Returns:
+        Executor: The shared pool
+    """
+    pool = _POOLS.get(kind)
+    if pool is None:
+        with _POOLS_LOCK:
+            pool = _POOLS.get(kind)
+            if pool is None:
+                pool_class = _lazy_import("ThreadPoolExecutor" if kind == "thread" else "ProcessPoolExecutor")
+                pool = pool_class()
+                _POOLS[kind] = pool
+    return pool
+
+
+def _discard_pool(kind, pool):
+    """
+    Forget a shared pool that can't run calls any more.
+
+    A process pool whose worker died (os._exit, OOM kill) is broken for
+    good; dropping it lets the next repeat() call start a fresh one.
+
+    Args:
+        kind (str): "thread" or "process"
+        pool (Executor): The broken pool
+    """
+    with _POOLS_LOCK:
+        if _POOLS.get(kind) is pool:
+            del _POOLS[kind]
+    pool.shutdown(wait=False)
+
+
+@atexit.register
+def shutdown_pools():
+    """Shut down the shared repeat() pools (they restart on next use)."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+def _call_repeat_target(module_name, qualname, /, *args, **kwargs):
+    """
+    Run the original function behind a repeat() wrapper in a worker process.
+
+    A decorated module-level function can't be pickled directly: pickle
+    looks it up by name and finds the wrapper instead. So we send the
+    name, and the worker follows __wrapped__ from the wrapper back to the
+    function repeat() was given.
+    """
+    target = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    while not hasattr(target, "__repeat_target__"):
+        target = target.__wrapped__
+    return target.__repeat_target__(*args, **kwargs)
+
+
+def _picklable_call(func):
+    """
+    Return a callable equivalent to func that can be sent to a worker.
+
+    Args:
+        func: The function given to repeat()
+
+    Returns:
+        callable: func itself, or a by-name stand-in for it
+    """
+    pickle = _lazy_import("pickle")
+    try:
+        pickle.dumps(func)
+        return func
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return functools.partial(_call_repeat_target, func.__module__, func.__qualname__)
+
+
+def repeat(n, concurrency=None, executor="serial"):
+    """
+    A decorator factory that calls the function n times.
+
+    Unlike repeat_three_times, the results are collected and returned as a
+    list, in call order. How the calls run depends on the function:
+
+    - Coroutine functions are awaited concurrently with asyncio.gather,
+      with at most concurrency calls in flight (None = all n at once).
+    - Regular functions run on the chosen executor: "serial" (one after
+      another), "thread" (shared thread pool, for I/O-bound work) or
+      "process" (shared process pool, for CPU-bound work). concurrency
+      caps how many calls are submitted at once.
+
+    If a call fails, its exception is raised to the caller (for
+    coroutines, the other calls are cancelled first).
+
+    Args:
+        n (int): How many times to call the function
+        concurrency (int): Limit for simultaneous calls
+        executor (str): "serial", "thread" or "process"
+
+    Returns:
+        decorator: A decorator that can be used with @ syntax
+
+    Example:
+        @repeat(8, executor="process")
+        def simulate(seed): ...
+    """
+    if n < 0:
+        raise ValueError("n cannot be negative!")
+    if concurrency is not None and concurrency < 1:
+        raise ValueError("concurrency must be at least 1!")
+    if executor not in _EXECUTORS:
+        raise ValueError(f"executor must be one of {', '.join(_EXECUTORS)}!")
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            if executor != "serial":
+                raise ValueError("Coroutine functions are repeated on the event loop; "
+                                 "executor only applies to regular functions!")
+            asyncio = _lazy_import("asyncio")
+
+            async def wrapper(*args, **kwargs):
+                if concurrency is None:
+                    calls = [func(*args, **kwargs) for _ in range(n)]
+                else:
+                    semaphore = asyncio.Semaphore(concurrency)
+
+                    async def limited():
+                        async with semaphore:
+                            return await func(*args, **kwargs)
+                    calls = [limited() for _ in range(n)]
+                tasks = [asyncio.ensure_future(call) for call in calls]
+                try:
+                    return await asyncio.gather(*tasks)
+                except BaseException:
+                    for task in tasks:
+                        task.cancel()
+                    raise
+        elif executor == "serial":
+            def wrapper(*args, **kwargs):
+                return [func(*args, **kwargs) for _ in range(n)]
+        else:
+            target = []  # resolved on first call, once the wrapper is bound
+
+            def wrapper(*args, **kwargs):
+                if not target:
+                    target.append(func if executor == "thread" else _picklable_call(func))
+                pool = _shared_pool(executor)
+                batch = max(n, 1) if concurrency is None else concurrency
+                results = []
+                try:
+                    for start in range(0, n, batch):
+                        futures = [pool.submit(target[0], *args, **kwargs)
+                                   for _ in range(min(batch, n - start))]
+                        try:
+                            results += [future.result() for future in futures]
+                        except BaseException:
+                            for future in futures:
+                                future.cancel()
+                            raise
+                except _lazy_import("BrokenExecutor"):
+                    _discard_pool(executor, pool)
+                    raise
+                return results
+
+        wrapper = functools.update_wrapper(wrapper, func)
+        wrapper.__repeat_target__ = func
+        return wrapper
+    return decorator
+
+
+def _async_examples():
+    """Run the async-aware decorator examples."""
+    asyncio = _lazy_import("asyncio")
+    print("\nExample 19: Async-aware decorators")
+
+    @my_decorator
+    async def say_hello_async():
+        """An async function decorated by the classic my_decorator."""
+        await asyncio.sleep(0)
+        print("👋 Hello from a coroutine!")
+
+    @repeat(5, concurrency=5)
+    async def fetch_status(delay):
+        """Simulate an I/O-bound call that takes `delay` seconds."""
+        await asyncio.sleep(delay)
+        return "ok"
+
+    asyncio.run(say_hello_async())
+    start = time.perf_counter()
+    statuses = asyncio.run(fetch_status(0.1))
+    print(f"  5 x 0.1s calls -> {statuses} in {time.perf_counter() - start:.2f}s")
+
+    print("\nExample 20: Repeating on a shared thread pool")
+
+    @repeat(4, executor="thread")
+    def slow_square(x):
+        """Simulate a blocking call that takes 0.1 seconds."""
+        time.sleep(0.1)
+        return x * x
+
+    start = time.perf_counter()
+    squares = slow_square(7)
+    print(f"  4 x 0.1s blocking calls -> {squares} in {time.perf_counter() - start:.2f}s")
+
+
+# ============================================================================
+# SUMMARY AND BEST PRACTICES
+# ============================================================================
+
+_SUMMARY = """
 📚 What We Learned:
 
 1. BASIC DECORATORS
@@ -931,9 +3136,52 @@ print("""
 - Overriding parent method? → @override
 
 Happy coding! 🐍✨
-""")
+"""
+
+
+def _summary():
+    """Print the summary and best practices."""
+    print("\n" + "=" * 60)
+    print("SUMMARY AND BEST PRACTICES")
+    print("=" * 60)
 
-print("\n" + "=" * 60)
-print("END OF TUTORIAL")
-print("=" * 60)
+    print(_SUMMARY)
 
+    print("\n" + "=" * 60)
+    print("END OF TUTORIAL")
+    print("=" * 60)
+
+
+# ============================================================================
+# RUNNING THE EXAMPLES
+# ============================================================================
+
+def run_examples():
+    """
+    Run every example in the tutorial, in order.
+
+    Importing this module only defines the classes, functions and
+    decorators - nothing is printed and no example objects are created.
+    The examples run when the file is executed as a script, or when
+    this function is called.
+    """
+    for examples in (
+        _section_1_examples,
+        _section_2_examples,
+        _section_3_examples,
+        _section_4_examples,
+        _section_5_examples,
+        _section_6_examples,
+        _section_7_examples,
+        _section_8_examples,
+        _combining_examples,
+        _fast_decorator_examples,
+        _memoize_examples,
+        _async_examples,
+        _summary,
+    ):
+        examples()
+
+
+if __name__ == "__main__":
+    run_examples()